@@ -5,7 +5,14 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('packages/core/src/metahq_core/export/citation_template.txt', 'metahq_core/export')],
-    hiddenimports=[],
+    hiddenimports=[
+        'metahq_cli.commands.delete',
+        'metahq_cli.commands.retrieve',
+        'metahq_cli.commands.search',
+        'metahq_cli.commands.setup',
+        'metahq_cli.commands.supported',
+        'metahq_cli.commands.validate',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
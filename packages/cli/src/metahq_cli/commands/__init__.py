@@ -1,8 +1,3 @@
-from metahq_cli.commands.delete import delete
-from metahq_cli.commands.retrieve import retrieve_commands
-from metahq_cli.commands.search import search
-from metahq_cli.commands.setup import setup
-from metahq_cli.commands.supported import supported
-from metahq_cli.commands.validate import validate
-
-__all__ = ["retrieve_commands", "setup", "search", "supported", "validate", "delete"]
+"""
+Commands of the MetaHQ CLI. Each is imported by `metahq_cli.main` on first use.
+"""
@@ -12,6 +12,7 @@ from pathlib import Path
 from metahq_cli.logger import setup_logger
 from metahq_cli.util.common_args import logging_args
 from metahq_core.util.supported import get_default_log_dir
+from metahq_cli.util.cache import clear_cache
 from metahq_cli.util.helpers import set_verbosity
 
 from metahq_core.util.supported import get_config, get_config_file
@@ -52,6 +53,8 @@ def delete(log_level: str, log_dir: str, quiet: bool, all: bool):
     ):
         logger.info("Deleting existing data directory...")
         shutil.rmtree(config["data_dir"])
+        logger.info("Deleting cached retrieval results...")
+        clear_cache()
         if all:
             logger.info("Deleting existing config directory...")
             shutil.rmtree(config_path.parent)
@@ -10,21 +10,17 @@ Last updated: 2026-04-01 by Parker Hicks
 from datetime import datetime
 
 import click
-from metahq_core.util.progress import get_console
-from metahq_core.util.supported import get_database_version, get_log_dir, supported
+from metahq_core.util.supported import get_database_version, get_log_dir
 
-from metahq_cli.logger import setup_logger
-from metahq_cli.retrieval_builder import Builder
-from metahq_cli.retriever import Retriever
 from metahq_cli.util.checkers import resolve_outdir
 from metahq_cli.util.common_args import (
+    AGE_GROUP_OPT,
     logging_args,
     ontology_retrieval_args,
     retrieval_args,
 )
 from metahq_cli.util.helpers import set_verbosity
 
-AGE_GROUP_OPT = click.Choice(supported("age_groups") + ["all"])
 NOW = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
@@ -57,27 +53,53 @@ def check_direct(mode: str, direct: bool, verbose: bool, logger) -> str:
     return mode
 
 
-# ===================================================
-# ==== entry point
-# ===================================================
-@click.group
-def retrieve_commands():
-    """Retrieval commands for tissue, disease, sex, and age annotations."""
+def run_retrieval(
+    attribute: str,
+    ontology: str,
+    terms: str,
+    level: str,
+    mode: str | None,
+    fmt: str,
+    metadata: str,
+    filters: dict[str, str],
+    license: str,
+    output: str,
+    log_level: str,
+    quiet: bool,
+    cache: bool = False,
+    direct: bool = False,
+):
+    """Builds the retrieval configurations and runs a retrieval.
 
+    Shared body of the `metahq retrieve` subcommands.
+
+    Parameters
+    ----------
+    attribute: str
+        The attribute to retrieve (e.g., 'tissue', 'disease', 'sex', 'age').
+
+    ontology: str
+        The ontology the terms come from. Same as `attribute` for sex and age.
+
+    mode: str | None
+        The user's passed mode. None for attributes that are only curated directly.
+
+    cache: bool
+        Reuse the curated result of an identical earlier retrieval.
+
+    direct: bool
+        Value of the hidden `direct` command argument.
+
+    The remaining parameters are the shared retrieval and logging arguments.
+
+    """
+    # deferred so that --help and other subcommands skip the query stack
+    from metahq_core.util.progress import get_console
+
+    from metahq_cli.logger import setup_logger
+    from metahq_cli.retrieval_builder import Builder
+    from metahq_cli.retriever import Retriever
 
-@retrieve_commands.command("age")
-@click.option(
-    "--terms",
-    type=AGE_GROUP_OPT,
-    default="all",
-    help="Age groups to choose. Can combine like 'fetus,adult'.",
-)
-@retrieval_args
-@logging_args
-def retrieve_age(
-    terms, level, fmt, metadata, filters, license, output, log_level, quiet
-):
-    """Retrieval command for age group annotations."""
     if metadata == "default":
         metadata = level
 
@@ -86,6 +108,14 @@ def retrieve_age(
         __name__, console=get_console(), level=log_level, log_dir=get_log_dir()
     )
 
+    if mode is None:
+        curation_mode = "direct"
+        mode = "annotate"  # show annotate instead of direct for interpretability
+    else:
+        # hidden from user. Used to test annotation quality.
+        mode = check_direct(mode, direct, verbose, log)
+        curation_mode = mode
+
     builder = Builder(logger=log, verbose=verbose)
 
     # parse and check filters
@@ -95,9 +125,8 @@ def retrieve_age(
     resolved_dir = resolve_outdir(output)
 
     # make configs
-    attribute = "age"
     query_config = builder.query_config("geo", attribute, level, filters, license)
-    curation_config = builder.curation_config(terms, "direct", attribute)
+    curation_config = builder.curation_config(terms, curation_mode, ontology)
     output_config = builder.output_config(
         resolved_dir, fmt, metadata, level=level, attribute=attribute
     )
@@ -107,7 +136,7 @@ def retrieve_age(
         terms=terms,
         level=level,
         filters=filters,
-        mode="annotate",  # show annotate instead of direct for interpretability
+        mode=mode,
         license=license,
         date=NOW,
         outdir=resolved_dir,
@@ -121,10 +150,49 @@ def retrieve_age(
         citation_config=citation_config,
         logger=log,
         verbose=verbose,
+        cache=cache,
     )
     retriever.retrieve()
 
 
+# ===================================================
+# ==== entry point
+# ===================================================
+@click.group
+def retrieve_commands():
+    """Retrieval commands for tissue, disease, sex, and age annotations."""
+
+
+@retrieve_commands.command("age")
+@click.option(
+    "--terms",
+    type=AGE_GROUP_OPT,
+    default="all",
+    help="Age groups to choose. Can combine like 'fetus,adult'.",
+)
+@retrieval_args
+@logging_args
+def retrieve_age(
+    terms, level, fmt, metadata, filters, license, output, cache, log_level, quiet
+):
+    """Retrieval command for age group annotations."""
+    run_retrieval(
+        attribute="age",
+        ontology="age",
+        terms=terms,
+        level=level,
+        mode=None,
+        fmt=fmt,
+        metadata=metadata,
+        filters=filters,
+        license=license,
+        output=output,
+        log_level=log_level,
+        quiet=quiet,
+        cache=cache,
+    )
+
+
 @retrieve_commands.command("diseases")
 @click.option("--terms", type=str, default="MONDO:0004994,MONDO:0018177")
 @retrieval_args
@@ -139,114 +207,54 @@ def retrieve_diseases(
     filters,
     license,
     output,
+    cache,
     log_level,
     quiet,
     direct,
 ):
     """Retrieval command for disease ontology terms."""
-    if metadata == "default":
-        metadata = level
-
-    verbose = set_verbosity(quiet)
-    log = setup_logger(
-        __name__, console=get_console(), level=log_level, log_dir=get_log_dir()
-    )
-
-    # hidden from user. Used to test annotation quality.
-    mode = check_direct(mode, direct, verbose, log)
-    builder = Builder(logger=log, verbose=verbose)
-
-    # parse and check filters
-    filters = builder.get_filters(filters)
-
-    # resolve output directory (creates it, incrementing suffix if it exists)
-    resolved_dir = resolve_outdir(output)
-
-    # make configs
-    attribute = "disease"
-    query_config = builder.query_config("geo", attribute, level, filters, license)
-    curation_config = builder.curation_config(terms, mode, "mondo")
-    output_config = builder.output_config(
-        resolved_dir, fmt, metadata, level=level, attribute=attribute
-    )
-    citation_config = builder.citation_config(
-        version=get_database_version(),
-        attribute=attribute,
+    run_retrieval(
+        attribute="disease",
+        ontology="mondo",
         terms=terms,
         level=level,
-        filters=filters,
         mode=mode,
+        fmt=fmt,
+        metadata=metadata,
+        filters=filters,
         license=license,
-        date=NOW,
-        outdir=resolved_dir,
+        output=output,
+        log_level=log_level,
+        quiet=quiet,
+        cache=cache,
+        direct=direct,
     )
 
-    # retrieve
-    retriever = Retriever(
-        query_config=query_config,
-        curation_config=curation_config,
-        output_config=output_config,
-        citation_config=citation_config,
-        logger=log,
-        verbose=verbose,
-    )
-    retriever.retrieve()
-
 
 @retrieve_commands.command("sex")
 @click.option("--terms", type=str, default="male,female")
 @retrieval_args
 @logging_args
 def retrieve_sex(
-    terms, level, fmt, metadata, filters, license, output, log_level, quiet
+    terms, level, fmt, metadata, filters, license, output, cache, log_level, quiet
 ):
     """Retrieval command for sex annotations."""
-    if metadata == "default":
-        metadata = level
-
-    verbose = set_verbosity(quiet)
-    log = setup_logger(
-        __name__, console=get_console(), level=log_level, log_dir=get_log_dir()
-    )
-
-    builder = Builder(logger=log, verbose=verbose)
-
-    # parse and check filters
-    filters = builder.get_filters(filters)
-
-    # resolve output directory (creates it, incrementing suffix if it exists)
-    resolved_dir = resolve_outdir(output)
-
-    # make configs
-    attribute = "sex"
-    query_config = builder.query_config("geo", attribute, level, filters, license)
-    curation_config = builder.curation_config(terms, "direct", attribute)
-    output_config = builder.output_config(
-        resolved_dir, fmt, metadata, level=level, attribute=attribute
-    )
-    citation_config = builder.citation_config(
-        version=get_database_version(),
-        attribute=attribute,
+    run_retrieval(
+        attribute="sex",
+        ontology="sex",
         terms=terms,
         level=level,
+        mode=None,
+        fmt=fmt,
+        metadata=metadata,
         filters=filters,
-        mode="annotate",  # show annotate instead of direct for interpretability
         license=license,
-        date=NOW,
-        outdir=resolved_dir,
+        output=output,
+        log_level=log_level,
+        quiet=quiet,
+        cache=cache,
     )
 
-    # retrieve
-    retriever = Retriever(
-        query_config=query_config,
-        curation_config=curation_config,
-        output_config=output_config,
-        citation_config=citation_config,
-        logger=log,
-        verbose=verbose,
-    )
-    retriever.retrieve()
-
 
 @retrieve_commands.command("tissues")
 @click.option("--terms", type=str, default="UBERON:0000948,UBERON:0000955")
@@ -262,55 +270,25 @@ def retrieve_tissues(
     filters,
     license,
     output,
+    cache,
     log_level,
     quiet,
     direct,
 ):
     """Retrieval command for tissue ontology terms."""
-    if metadata == "default":
-        metadata = level
-
-    verbose = set_verbosity(quiet)
-    log = setup_logger(
-        __name__, console=get_console(), level=log_level, log_dir=get_log_dir()
-    )
-
-    # hidden from user. Used to test annotation quality.
-    mode = check_direct(mode, direct, verbose, log)
-    builder = Builder(logger=log, verbose=verbose)
-
-    # parse and check filters
-    filters = builder.get_filters(filters)
-
-    # resolve output directory (creates it, incrementing suffix if it exists)
-    resolved_dir = resolve_outdir(output)
-
-    # make configs
-    attribute = "tissue"
-    query_config = builder.query_config("geo", attribute, level, filters, license)
-    curation_config = builder.curation_config(terms, mode, "uberon")
-    output_config = builder.output_config(
-        resolved_dir, fmt, metadata, level=level, attribute=attribute
-    )
-    citation_config = builder.citation_config(
-        version=get_database_version(),
-        attribute=attribute,
+    run_retrieval(
+        attribute="tissue",
+        ontology="uberon",
         terms=terms,
         level=level,
-        filters=filters,
         mode=mode,
+        fmt=fmt,
+        metadata=metadata,
+        filters=filters,
         license=license,
-        date=NOW,
-        outdir=resolved_dir,
+        output=output,
+        log_level=log_level,
+        quiet=quiet,
+        cache=cache,
+        direct=direct,
     )
-
-    # retrieve
-    retriever = Retriever(
-        query_config=query_config,
-        curation_config=curation_config,
-        output_config=output_config,
-        citation_config=citation_config,
-        logger=log,
-        verbose=verbose,
-    )
-    retriever.retrieve()
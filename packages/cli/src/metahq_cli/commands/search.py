@@ -5,12 +5,10 @@ on metahq_core.search.search() to do the actual searching.
 Author: Faisal Alquaddoomi
 Date: 2025-09-25
 
-Last updated: 2025-11-24 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 import click
-from metahq_core.search import NoResultsFound
-from metahq_core.search import search as core_search
 from metahq_core.util.progress import get_console
 from metahq_core.util.supported import get_log_dir, get_ontology_search_db
 
@@ -79,6 +77,10 @@ def search(
     quiet,
 ):
     """Search for terms in the ontology database."""
+    # deferred so that --help skips polars and duckdb
+    from metahq_core.search import NoResultsFound
+    from metahq_core.search import search as core_search
+
     verbose = set_verbosity(quiet)
     logger = setup_logger(
         __name__, console=get_console(), level=log_level, log_dir=get_log_dir()
@@ -4,7 +4,7 @@ Command to set up the meta-hq CLI.
 Author: Parker Hicks
 Date: 2025-09-05
 
-Last updated: 2025-11-26 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 from pathlib import Path
@@ -14,8 +14,6 @@ from metahq_core.util.progress import console
 from metahq_core.util.supported import get_default_data_dir, get_default_log_dir
 
 from metahq_cli.logger import setup_logger
-from metahq_cli.setup.config import Config
-from metahq_cli.setup.downloader import Downloader
 from metahq_cli.util.common_args import logging_args
 from metahq_cli.util.helpers import set_verbosity
 from metahq_cli.util.supported import LATEST_DATABASE
@@ -46,6 +44,10 @@ from metahq_cli.util.supported import LATEST_DATABASE
 @logging_args
 def setup(doi: str, data_dir: str, log_level: str, log_dir: str, quiet: bool):
     """Download the MetaHQ database and configure the CLI."""
+    # deferred so that --help skips requests and yaml
+    from metahq_cli.setup.config import Config
+    from metahq_cli.setup.downloader import Downloader
+
     if log_dir == "default":
         log_dir = str(get_default_log_dir())
 
@@ -4,7 +4,7 @@ Logger setup.
 Author: Parker Hicks
 Date: 2025-10-16
 
-Last updated: 2026-02-04 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 from __future__ import annotations
@@ -32,11 +32,26 @@ class ColoredFormatter(logging.Formatter):
         "CRITICAL": "bold red",
     }
 
+    # markup for each level, built once instead of per record
+    PREFIXES = {
+        level: f"[{color}][{level}][/{color}]" for level, color in COLORS.items()
+    }
+
     def format(self, record):
         levelname = record.levelname
-        color = self.COLORS.get(levelname, "white")
-        record.levelname = f"[{color}][{levelname}][/{color}]"
-        return super().format(record)
+        prefix = self.PREFIXES.get(levelname)
+        if prefix is None:
+            prefix = f"[white][{levelname}][/white]"
+        record.levelname = prefix
+        try:
+            return super().format(record)
+        finally:
+            # the record is shared with the file handler, which must not see markup
+            record.levelname = levelname
+
+
+# handlers shared by every logger writing to the same console and log directory
+_HANDLERS: dict[tuple[int, str], tuple[logging.Handler, logging.Handler]] = {}
 
 
 def setup_logger(
@@ -67,10 +82,29 @@ def setup_logger(
     logger = logging.getLogger(name)
     _level = check_loglevel(level)
 
-    if logger.hasHandlers():
+    # only this logger's own handlers; ancestors may carry unrelated handlers
+    if logger.handlers:
         return logger
 
     logger.setLevel(_level)
+    for handler in _shared_handlers(console, log_dir):
+        logger.addHandler(handler)
+
+    return logger
+
+
+def _shared_handlers(
+    console: Console, log_dir: str | Path
+) -> tuple[logging.Handler, logging.Handler]:
+    """Returns the console and file handlers for a console and log directory.
+
+    Handlers are built once and shared across logger names, so each command opens
+    the log file once no matter how many modules set up a logger.
+    """
+    # the cached handler holds the console, so its id is not reused
+    key = (id(console), str(Path(log_dir).resolve()))
+    if key in _HANDLERS:
+        return _HANDLERS[key]
 
     # rich console handler
     console_handler = RichHandler(
@@ -90,7 +124,6 @@ def setup_logger(
         style="{",
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     # file handler
     file_handler = logging.FileHandler(
@@ -104,6 +137,6 @@ def setup_logger(
         datefmt="%Y-%m-%d %H:%M",
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
-    return logger
+    _HANDLERS[key] = (console_handler, file_handler)
+    return _HANDLERS[key]
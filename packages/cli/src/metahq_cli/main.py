@@ -9,20 +9,23 @@ Last updated: 2025-09-05
 
 import click
 
-from metahq_cli.commands import retrieve_commands, search, setup, supported, validate, delete
-
-
-@click.group()
+from metahq_cli.util.lazy_group import LazyGroup
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "setup": "metahq_cli.commands.setup.setup",
+        "search": "metahq_cli.commands.search.search",
+        "supported": "metahq_cli.commands.supported.supported",
+        "retrieve": "metahq_cli.commands.retrieve.retrieve_commands",
+        "validate": "metahq_cli.commands.validate.validate",
+        "delete": "metahq_cli.commands.delete.delete",
+    },
+)
 def main():
     pass
 
 
-main.add_command(setup)
-main.add_command(search)
-main.add_command(supported)
-main.add_command(retrieve_commands, name="retrieve")
-main.add_command(validate)
-main.add_command(delete)
-
 if __name__ == "__main__":
     main()
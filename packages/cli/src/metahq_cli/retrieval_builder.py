@@ -4,16 +4,16 @@ Class to take retrieval arguments, check them, and build the retrieval query.
 Author: Parker Hicks
 Date: 2025-10-16
 
-Last updated: 2026-04-01 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import polars as pl
 from metahq_core.export.references import CitationConfig
+from metahq_core.relations_loader import relation_terms
 from metahq_core.util.exceptions import NoResultsFound
-from metahq_core.util.supported import get_ontology_families
+from metahq_core.util.supported import get_ontology_families, sexes, supported
 
 from metahq_cli.retriever import CurationConfig, OutputConfig, QueryConfig
 from metahq_cli.util.checkers import (
@@ -25,6 +25,7 @@ from metahq_cli.util.checkers import (
     check_metadata,
     check_mode,
 )
+from metahq_cli.util.helpers import parse_filters
 from metahq_cli.util.messages import TruncatedList
 from metahq_cli.util.supported import required_filters
 
@@ -41,12 +42,13 @@ class Builder:
         self.log: logging.Logger = logger
         self.verbose: bool = verbose
 
-    def get_filters(self, filters: str) -> dict[str, str]:
+    def get_filters(self, filters: str | dict[str, str]) -> dict[str, str]:
         """Parses and checks requested filters.
 
         Arguments:
-            filters (str):
-                A comma-delimited string of supported MetaHQ filters.
+            filters (str | dict[str, str]):
+                A comma-delimited string of supported MetaHQ filters, or filters already
+                parsed by the `--filters` option.
 
         Returns:
             A dictionary of filter key, values.
@@ -79,26 +81,28 @@ class Builder:
         Raises:
             NoResultsFound: If none of the terms are in the MetaHQ database.
         """
-        available = (
-            pl.scan_parquet(get_ontology_families(reference)["relations"])
-            .collect_schema()
-            .names()
-        )
+        if not terms:
+            msg = f"No {reference.upper()} terms were provided."
+            if self.verbose:
+                self.log.error(msg)
+            raise NoResultsFound(msg)
+
+        available = relation_terms(get_ontology_families(reference)["relations"])
 
         if terms == "all":
             return available
 
-        parsed = self._parse(terms, available)
+        _available = set(available)
+        parsed = self._parse(terms, _available)
 
-        # check if terms are missing
-        diff = abs(len(terms) - len(parsed))
-        if diff > 0:
-            missing = list(set(terms) - set(parsed))
+        # check if terms are missing, keeping the order they were requested in
+        missing = [term for term in dict.fromkeys(terms) if term not in _available]
+        if missing:
             if len(missing) > 10:
                 missing = TruncatedList(missing)
 
             # fail if all are missing
-            if diff == len(terms):
+            if not parsed:
                 msg = (
                     f"""Terms: {missing} have no annotations for: {reference.upper()}"""
                 )
@@ -186,14 +190,10 @@ class Builder:
             return self.make_age_curation(terms, mode)
 
         if terms == "all":
+            # already the full set of terms in the relations schema
             _terms = self.parse_onto_terms(terms, ontology)
         else:
-            _terms = check_if_txt(terms)
-
-        if isinstance(_terms, str):
-            _terms = _terms.split(",")
-
-        _terms = self.parse_onto_terms(_terms, ontology)
+            _terms = self.parse_onto_terms(check_if_txt(terms), ontology)
 
         return CurationConfig(mode, _terms, ontology)
 
@@ -211,7 +211,7 @@ class Builder:
             outdir (Path):
                 Resolved output directory (created by `resolve_outdir`).
 
-            fmt (Literal["json", "parquet", "csv", "tsv"]):
+            fmt (Literal["json", "parquet", "arrow", "csv", "tsv"]):
                 Format of the output file.
 
             metadata (str):
@@ -297,17 +297,9 @@ class Builder:
         _terms = check_if_txt(terms)
         check_mode("age", mode)
 
-        if _terms == "all":
-            from metahq_core.util.supported import supported
-
+        if _terms == ["all"]:
             _terms = supported("age_groups")
 
-        elif isinstance(_terms, str):
-            _terms = _terms.split(",")
-
-        else:
-            self.log.error("Invalid input: %s", terms)
-
         return CurationConfig(mode, _terms, ontology="age")
 
     def make_sex_curation(self, terms: str, mode: str):
@@ -315,46 +307,31 @@ class Builder:
         _terms = check_if_txt(terms)
         check_mode("sex", mode)
 
-        if _terms == "all":
-            from metahq_core.util.supported import sexes
-
+        if _terms == ["all"]:
             _terms = sexes()
 
-        elif isinstance(_terms, str):
-            _terms = _terms.split(",")
-
-        else:
-            self.log.error("Invalid input: %s", terms)
-
         _terms = self._map_sex_to_id(_terms)
         return CurationConfig(mode, _terms, ontology="sex")
 
     def _map_sex_to_id(self, terms: list[str]):
         """Map male to M and female to F if passed."""
         opt = {"male": "M", "female": "F"}
+        return [opt.get(term, term) for term in terms]
 
-        result = []
-        for term in terms:
-            if term in ["male", "female"]:
-                result.append(opt[term])
-            else:
-                result.append(term)
-
-        return result
+    def _parse(self, terms: list[str], available: list[str] | set[str]) -> list[str]:
+        _available = available if isinstance(available, set) else set(available)
+        return [term for term in terms if term in _available]
 
-    def _parse(self, terms: list[str], available: list[str]) -> list[str]:
-        return [term for term in terms if term in available]
-
-    def _parse_filters(self, filters: str) -> dict[str, str]:
-        as_list: list[list[str]] = [f.split("=") for f in filters.split(",")]
-        as_dict: dict[str, str] = {f[0]: f[1] for f in as_list}
+    def _parse_filters(self, filters: str | dict[str, str]) -> dict[str, str]:
+        as_dict: dict[str, str] = (
+            filters if isinstance(filters, dict) else parse_filters(filters)
+        )
 
-        not_in_filters: list[str] = []
-        for key in required_filters():
-            if key not in as_dict:
-                not_in_filters.append(key)
+        not_in_filters: list[str] = [
+            key for key in required_filters() if key not in as_dict
+        ]
 
-        if len(not_in_filters) > 0:
+        if not_in_filters:
             msg: str = f"Missing required filters {not_in_filters}."
             self.log.error(msg)
             raise RuntimeError(msg)
@@ -364,8 +341,8 @@ class Builder:
     def report_bad_filters(self, filters: dict[str, str]):
         """Check filters and return improper filter parameters."""
         bad_filters = check_filter_keys(filters)
-        if len(bad_filters) > 0:
-            msg = ("Expected filters in %s, got %s.", required_filters(), bad_filters)
+        if bad_filters:
+            msg = f"Expected filters in {required_filters()}, got {bad_filters}."
 
             if self.verbose:
                 self.log.error(msg)
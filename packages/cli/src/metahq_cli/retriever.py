@@ -19,6 +19,7 @@ from metahq_core.query import Query
 from metahq_core.util.exceptions import NoResultsFound
 from metahq_core.util.supported import supported
 
+from metahq_cli.util.cache import load_curation, retrieval_key, save_curation
 from metahq_cli.util.messages import TruncatedList
 
 if TYPE_CHECKING:
@@ -89,7 +90,7 @@ class OutputConfig:
         outfile (str | Path):
             Path to file to store annotations.
 
-        fmt (Literal["json", "parquet", "csv", "tsv"]):
+        fmt (Literal["json", "parquet", "arrow", "csv", "tsv"]):
             Format of the output file.
 
         metadata (str):
@@ -103,7 +104,7 @@ class OutputConfig:
     """
 
     outfile: str | Path
-    fmt: Literal["json", "parquet", "csv", "tsv"]
+    fmt: Literal["json", "parquet", "arrow", "csv", "tsv"]
     metadata: str
     attribute: str
     level: str
@@ -126,6 +127,10 @@ class Retriever:
 
         citation_config: CitationConfig
             Parameters for saving citations.
+
+        cache: bool
+            Reuse the curated result of an identical earlier retrieval, and cache
+            new results.
     """
 
     def __init__(
@@ -136,11 +141,13 @@ class Retriever:
         citation_config,
         logger,
         verbose=True,
+        cache=False,
     ):
         self.query_config: QueryConfig = query_config
         self.curation_config: CurationConfig = curation_config
         self.output_config: OutputConfig = output_config
         self.citation_config: CitationConfig = citation_config
+        self.cache: bool = cache
 
         self.log: logging.Logger = logger
         self.verbose: bool = verbose
@@ -184,9 +191,23 @@ class Retriever:
         return self._query_silent()
 
     def retrieve(self):
-        """Performs the retrieval pipeline: query -> curate -> save."""
-        curation = self.query()
-        curation = self.curate(curation)
+        """Performs the retrieval pipeline: query -> curate -> save.
+
+        With `cache`, query and curate are skipped when an identical retrieval
+        was already cached.
+        """
+        key, curation = None, None
+        if self.cache:
+            key = retrieval_key(self.query_config, self.curation_config)
+            curation = load_curation(key, logger=self.log, verbose=self.verbose)
+            if curation is not None and self.verbose:
+                self.log.info("Using cached retrieval result.")
+
+        if curation is None:
+            curation = self.curate(self.query())
+            if key is not None:
+                save_curation(curation, key)
+
         self.save_curation(curation)
 
     def save_curation(self, curation: Annotations | Labels):
@@ -225,8 +246,10 @@ class Retriever:
 
         available_terms = self._filter_missing_entities(curation)
 
+        # annotations are 0/1, so a single max reduction replaces one boolean
+        # comparison column per term
         return curation.select(available_terms).filter(
-            pl.any_horizontal(pl.col(available_terms) == 1)
+            pl.max_horizontal(available_terms) == 1
         )
 
     def _propagate_annotations(
@@ -246,6 +269,11 @@ class Retriever:
         if self.verbose:
             self.log.info("Querying...")
 
+        # direct mode only needs the requested terms, so skip pivoting the rest
+        terms = None
+        if self.curation_config.mode == "direct":
+            terms = self.curation_config.terms
+
         return Query(
             database=self.query_config.database,
             attribute=self.query_config.attribute,
@@ -256,18 +284,19 @@ class Retriever:
             license=self.query_config.license,
             logger=self.log,
             verbose=self.verbose,
-        ).annotations()
+        ).annotations(terms=terms)
 
     def _query_silent(self):
         return self._query()
 
     def _filter_missing_entities(self, curation: Annotations | Labels) -> list[str]:
-        terms_with_anno = [
-            term for term in self.curation_config.terms if term in curation.entities
-        ]
-        not_in_anno = [
-            term for term in self.curation_config.terms if not term in terms_with_anno
-        ]
+        entities = set(curation.entities)
+        terms_with_anno, not_in_anno = [], []
+        for term in self.curation_config.terms:
+            if term in entities:
+                terms_with_anno.append(term)
+            else:
+                not_in_anno.append(term)
 
         if len(not_in_anno) == len(self.curation_config.terms):
             msg = "No annotations for any terms. Try using different conditions."
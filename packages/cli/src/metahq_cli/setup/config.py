@@ -4,7 +4,7 @@ Command to setup the metahq configuration.
 Author: Parker Hicks
 Date: 2025-09-05
 
-Last updated: 2025-12-15 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 import sys
@@ -12,8 +12,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import yaml
+from metahq_core.util.io import load_yaml
 from metahq_core.util.progress import console
-from metahq_core.util.supported import get_config_file_no_check
+from metahq_core.util.supported import get_config_file_no_check, save_config_json
 
 from metahq_cli.logger import setup_logger
 
@@ -103,11 +104,7 @@ class Config:
 
     def load_config(self) -> dict[str, str]:
         """Loads the meta-hq config file."""
-        with open(CONFIG_FILE, "r", encoding="utf-8") as stream:
-            try:
-                return yaml.safe_load(stream)
-            except yaml.YAMLError as e:
-                sys.exit(str(e))
+        return load_yaml(CONFIG_FILE)
 
     def load_config_str(self) -> str:
         """Loads the meta-hq config file."""
@@ -134,9 +131,12 @@ class Config:
         self.logger.info("Saving MetaHQ config to %s", CONFIG_FILE)
         with open(CONFIG_FILE, "w", encoding="utf-8") as stream:
             try:
-                yaml.safe_dump(config, stream)
+                # libyaml-backed dumper when PyYAML was built with it
+                dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                yaml.dump(config, stream, Dumper=dumper)
             except yaml.YAMLError as e:
                 sys.exit(str(e))
+        save_config_json(config, CONFIG_FILE)
         self.logger.info("Done!")
 
     def setup(self):
@@ -5,12 +5,17 @@ Implemented in the `metahq setup` CLI command.
 Author: Parker Hicks
 Date: 2025-11-20
 
-Last updated: 2026-02-05 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
+from __future__ import annotations
+
+import json
 import shutil
 import sys
 import tarfile
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -31,10 +36,30 @@ from metahq_cli.util.supported import (
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Callable
 
 
 DEFAULT_OUTDIR: Path = default_data_dir()
 
+# bytes read from a response stream per write
+DOWNLOAD_CHUNK_SIZE: int = 1 << 20
+
+# smallest byte range fetched by a single request in a ranged download
+MIN_PART_SIZE: int = 8 << 20
+
+# number of byte ranges fetched concurrently
+DOWNLOAD_THREADS: int = 8
+
+# attempts at a single byte range before the whole download is retried
+PART_RETRIES: int = 3
+
+# bytes read from the archive and written per member file during extraction
+EXTRACT_BUFFER_SIZE: int = 1 << 20
+
+HEADERS: dict[str, str] = {
+    "User-Agent": "<meta-hq>/v1 (https://github.com/krishnanlab/meta-hq)"
+}
+
 
 @dataclass
 class FileConfig:
@@ -82,6 +107,11 @@ class FileConfig:
         """Return path to the database file on the user's system."""
         return self.outdir / self.filename
 
+    @property
+    def parts_file(self) -> Path:
+        """Return path to the record of completed byte ranges of a download."""
+        return self.outdir / f"{self.filename}.parts.json"
+
     @property
     def size_mb(self) -> float:
         """Return the filesize in MB."""
@@ -133,6 +163,14 @@ class Downloader:
         self.verbose: bool = verbose
 
         self._use_progress: bool = True
+        self._accepts_ranges: bool = False
+
+        # one keep-alive session so HEAD, GET, and every byte range reuse connections
+        self._session: requests.Session = requests.Session()
+        self._session.headers.update(HEADERS)
+        self._session.mount(
+            "https://", requests.adapters.HTTPAdapter(pool_maxsize=DOWNLOAD_THREADS)
+        )
 
     def check_outdir_exists(self):
         """Check if the data directory exists."""
@@ -165,6 +203,12 @@ class Downloader:
 
     def get(self, num_retries=10):
         """Downloads the database .tar.gz file from Zenodo."""
+        try:
+            self._get(num_retries)
+        finally:
+            self._session.close()
+
+    def _get(self, num_retries: int):
         self.check_outdir_exists()
 
         num_tries = 0
@@ -217,14 +261,16 @@ class Downloader:
             self.logger.debug("Downloading from URL: %s", self.config.url)
             self.logger.info("Checking file availability...")
 
-        head = requests.head(self.config.url, allow_redirects=True, timeout=10)
+        head = self._session.head(self.config.url, allow_redirects=True, timeout=10)
         self.config.filesize = int(head.headers.get("content-length", 0))
+        self._accepts_ranges = head.headers.get("accept-ranges", "").lower() == "bytes"
 
         if self.verbose:
             self.logger.debug("Request status: %s", head.status_code)
             self.logger.debug("Request headers: %s", dict(head.headers))
             self.logger.debug("Final URL: %s", head.url)
             self.logger.debug("File size: %s MB", self.config.size_mb)
+            self.logger.debug("Ranged download: %s", self._accepts_ranges)
 
         if self.config.filesize == 0:
             self._use_progress = False
@@ -252,46 +298,161 @@ class Downloader:
             self._download_no_progress()
 
     def _download_with_progress(self):
-        response = requests.get(
-            self.config.url,
-            stream=True,
-            allow_redirects=True,
-            timeout=30,
-            headers={
-                "User-Agent": "<meta-hq>/v1 (https://github.com/krishnanlab/meta-hq)"
-            },
-        )
         with progress_bar(padding="    ") as progress:
             task = progress.add_task("Downloading", total=self.config.filesize)
 
+            def advance(n: int):
+                progress.update(task, advance=n)
+
+            if self._accepts_ranges:
+                self._download_ranges(advance)
+                return
+
+            response = self._session.get(
+                self.config.url,
+                stream=True,
+                allow_redirects=True,
+                timeout=30,
+            )
             with open(self.config.outfile, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
-                    progress.update(task, advance=len(chunk))
+                    advance(len(chunk))
 
     def _download_no_progress(self):
-        response = requests.get(
+        response = self._session.get(
             self.config.url,
             stream=True,
             allow_redirects=True,
             timeout=30,
-            headers={
-                "User-Agent": "<meta-hq>/v1 (https://github.com/krishnanlab/meta-hq)"
-            },
         )
         with open(self.config.outfile, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 f.write(chunk)
 
+    def _download_ranges(self, advance: Callable[[int], None]):
+        """Download the file as concurrent byte ranges.
+
+        Completed ranges are recorded in `FileConfig.parts_file` as they finish,
+        so a retried download only fetches the ranges that are still missing.
+        """
+        outfile, parts_file = self.config.outfile, self.config.parts_file
+        parts = self._make_parts()
+
+        done: set[int] = set()
+        if parts_file.exists() and outfile.exists():
+            done = set(json.loads(parts_file.read_text()))
+
+        # preallocate so each range can be written at its offset
+        with open(outfile, "ab") as f:
+            f.truncate(self.config.filesize)
+
+        advance(sum(end - start + 1 for start, end in parts if start in done))
+        todo = [(start, end) for start, end in parts if start not in done]
+
+        if self.verbose:
+            self.logger.debug(
+                "Downloading %s of %s byte ranges.", len(todo), len(parts)
+            )
+
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def fetch(start: int, end: int):
+            self._download_part(start, end, advance, stop)
+            with lock:
+                done.add(start)
+                parts_file.write_text(json.dumps(sorted(done)))
+
+        pool = ThreadPoolExecutor(max_workers=min(DOWNLOAD_THREADS, len(parts)))
+        try:
+            futures = [pool.submit(fetch, start, end) for start, end in todo]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # abandon in-flight and queued ranges instead of finishing the file
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        pool.shutdown()
+        parts_file.unlink()
+
+    def _download_part(
+        self,
+        start: int,
+        end: int,
+        advance: Callable[[int], None],
+        stop: threading.Event | None = None,
+    ) -> int:
+        """Download bytes `start` through `end` into the output file.
+
+        Network and write errors are retried up to `PART_RETRIES` times. Progress
+        from a failed attempt is rolled back before the range is fetched again.
+        """
+        attempt = 1
+        while True:
+            fetched = 0
+            try:
+                response = self._session.get(
+                    self.config.url,
+                    stream=True,
+                    allow_redirects=True,
+                    timeout=30,
+                    headers={"Range": f"bytes={start}-{end}"},
+                )
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise RuntimeError("Server did not honor the requested byte range.")
+
+                with open(self.config.outfile, "r+b") as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if stop is not None and stop.is_set():
+                            raise CancelledError(f"Byte range {start}-{end} cancelled.")
+                        f.write(chunk)
+                        fetched += len(chunk)
+                        advance(len(chunk))
+
+                if fetched != end - start + 1:
+                    raise OSError(f"Incomplete byte range {start}-{end}.")
+
+                return start
+
+            except (requests.exceptions.RequestException, OSError):
+                advance(-fetched)
+                if attempt == PART_RETRIES:
+                    raise
+
+                if self.verbose:
+                    self.logger.debug("Retrying byte range %s-%s.", start, end)
+                attempt += 1
+
+    def _make_parts(self) -> list[tuple[int, int]]:
+        """Split the file into inclusive byte ranges."""
+        filesize = self.config.filesize or 0
+        part_size = max(MIN_PART_SIZE, -(-filesize // (4 * DOWNLOAD_THREADS)))
+        return [
+            (start, min(start + part_size, filesize) - 1)
+            for start in range(0, filesize, part_size)
+        ]
+
     # ========================================
     # ======  tar extractors
     # ========================================
 
     def _extract(self):
-        with tarfile.open(self.config.outfile, mode="r:gz") as tar:
-            tar.extractall(
-                path=self.config.outdir, members=tar.getmembers(), filter="data"
-            )
+        # stream the archive in one sequential pass instead of seeking through it
+        with (
+            open(self.config.outfile, "rb", buffering=EXTRACT_BUFFER_SIZE) as f,
+            tarfile.open(
+                fileobj=f,
+                mode="r|gz",
+                bufsize=EXTRACT_BUFFER_SIZE,
+                copybufsize=EXTRACT_BUFFER_SIZE,
+            ) as tar,
+        ):
+            tar.extractall(path=self.config.outdir, filter="data")
 
     def _move_tar_contents(self, base_dir: Path, tar_dir: Path):
         target_dir = base_dir
@@ -355,6 +516,7 @@ class Downloader:
         if self.config.outfile.exists():
             self.config.outfile.unlink()
             self.logger.info("Removed partial download: %s", self.config.outfile)
+        self.config.parts_file.unlink(missing_ok=True)
         sys.exit(130)
 
     def _raise_permissions_error(self):
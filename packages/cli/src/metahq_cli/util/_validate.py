@@ -3,269 +3,101 @@ Helper info for validate command.
 """
 
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# expected MD5 checksum of each database file relative to the data directory,
+# by Zenodo DOI
+_MANIFESTS: dict[str, dict[str, str]] = {
+    "20186688": {
+        "annotations/combined__level-sample.bson": "bb6db3b78fd7c143cf7de23911019729",
+        "annotations/combined__level-series.bson": "f19da03cb818c5c9146439f21c72a476",
+        "metadata/metadata__level-sample.parquet": "c13a4483f730739c2fd43b5c8fc06416",
+        "metadata/metadata__level-series.parquet": "bd6c597b8c66c74d367284e396f18864",
+        "metadata/technologies.parquet": "a7cd45dc7db09d30fe35676d8d449b32",
+        "ontology/ontology_search.duckdb": "14096af77a2080025cb64fb3a512c0c8",
+        "ontology/mondo/id_map.parquet": "37230bd391ec3af4be4f710ab2d76707",
+        "ontology/mondo/names_synonyms.json": "24318fa528ded695943b53787c0c7b00",
+        "ontology/mondo/relations.parquet": "743cb555c82752c19936471855a05c48",
+        "ontology/mondo/systems.txt": "dbf3e5566b4dd80e458b2cd5813ad693",
+        "ontology/uberon_ext/id_map.parquet": "a449bed0812bacfa35d9b83628da594e",
+        "ontology/uberon_ext/names_synonyms.json": "9e9fd448715929351e8c0e4b9561d56c",
+        "ontology/uberon_ext/relations.parquet": "41986e2e0cb31be122720b59f41bbe56",
+        "ontology/uberon_ext/systems.txt": "8e2b4b0943ae52720463257d67ec8fbf",
+    },
+    "18462463": {
+        "annotations/combined__level-sample.bson": "07c761c25eeb37787b13e3f0be7ea4db",
+        "annotations/combined__level-series.bson": "4a70f6c1a4cdd693cf33b50c561e960b",
+        "metadata/metadata__level-sample.parquet": "2527ffbc7b7bacd6054841b395975b8b",
+        "metadata/metadata__level-series.parquet": "0215ea97cf1e09e98a43d219b53b254f",
+        "metadata/technologies.parquet": "a7cd45dc7db09d30fe35676d8d449b32",
+        "ontology/ontology_search.duckdb": "5108270059472abc4a18e0ee3a7c68f2",
+        "ontology/mondo/id_map.parquet": "37230bd391ec3af4be4f710ab2d76707",
+        "ontology/mondo/names_synonyms.json": "24318fa528ded695943b53787c0c7b00",
+        "ontology/mondo/relations.parquet": "9d460ad0eaa06d85767717e2f6456163",
+        "ontology/mondo/systems.txt": "dbf3e5566b4dd80e458b2cd5813ad693",
+        "ontology/uberon_ext/id_map.parquet": "a449bed0812bacfa35d9b83628da594e",
+        "ontology/uberon_ext/names_synonyms.json": "9e9fd448715929351e8c0e4b9561d56c",
+        "ontology/uberon_ext/relations.parquet": "a9c3cead75ac43c2be3b961d69d25d53",
+        "ontology/uberon_ext/systems.txt": "8e2b4b0943ae52720463257d67ec8fbf",
+    },
+    "17666183": {
+        "annotations/combined__level-sample.bson": "5d41627b6194b34e19bda2edf9289b6d",
+        "annotations/combined__level-series.bson": "c4280f1432a001ebe031d6eb4d7b5c5c",
+        "metadata/metadata__level-sample.parquet": "5ab5771210d31f6cc3d81c29fec20a7e",
+        "metadata/metadata__level-series.parquet": "06629fd37a62905e79e31e8eaddf021d",
+        "metadata/technologies.parquet": "a7cd45dc7db09d30fe35676d8d449b32",
+        "ontology/ontology_search.duckdb": "5108270059472abc4a18e0ee3a7c68f2",
+        "ontology/mondo/id_map.parquet": "37230bd391ec3af4be4f710ab2d76707",
+        "ontology/mondo/names_synonyms.json": "24318fa528ded695943b53787c0c7b00",
+        "ontology/mondo/relations.parquet": "9d460ad0eaa06d85767717e2f6456163",
+        "ontology/mondo/systems.txt": "dbf3e5566b4dd80e458b2cd5813ad693",
+        "ontology/uberon_ext/id_map.parquet": "a449bed0812bacfa35d9b83628da594e",
+        "ontology/uberon_ext/names_synonyms.json": "9e9fd448715929351e8c0e4b9561d56c",
+        "ontology/uberon_ext/relations.parquet": "a9c3cead75ac43c2be3b961d69d25d53",
+        "ontology/uberon_ext/systems.txt": "b5327f3e6591768bcdb24b1b083cd0ea",
+    },
+}
+# same files as 20186688
+_MANIFESTS["20184525"] = _MANIFESTS["20186688"]
 
-def get_files_to_check(doi):
-    if doi == "20186688":
-        FILES_TO_CHECK = [
-            [
-                Path("annotations") / "combined__level-sample.bson",
-                "bb6db3b78fd7c143cf7de23911019729",
-            ],
-            [
-                Path("annotations") / "combined__level-series.bson",
-                "f19da03cb818c5c9146439f21c72a476",
-            ],
-            [
-                Path("metadata") / "metadata__level-sample.parquet",
-                "c13a4483f730739c2fd43b5c8fc06416",
-            ],
-            [
-                Path("metadata") / "metadata__level-series.parquet",
-                "bd6c597b8c66c74d367284e396f18864",
-            ],
-            [
-                Path("metadata") / "technologies.parquet",
-                "a7cd45dc7db09d30fe35676d8d449b32",
-            ],
-            [
-                Path("ontology") / "ontology_search.duckdb",
-                "14096af77a2080025cb64fb3a512c0c8",
-            ],
-            [
-                Path("ontology") / "mondo" / "id_map.parquet",
-                "37230bd391ec3af4be4f710ab2d76707",
-            ],
-            [
-                Path("ontology") / "mondo" / "names_synonyms.json",
-                "24318fa528ded695943b53787c0c7b00",
-            ],
-            [
-                Path("ontology") / "mondo" / "relations.parquet",
-                "743cb555c82752c19936471855a05c48",
-            ],
-            [
-                Path("ontology") / "mondo" / "systems.txt",
-                "dbf3e5566b4dd80e458b2cd5813ad693",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "id_map.parquet",
-                "a449bed0812bacfa35d9b83628da594e",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "names_synonyms.json",
-                "9e9fd448715929351e8c0e4b9561d56c",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "relations.parquet",
-                "41986e2e0cb31be122720b59f41bbe56",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "systems.txt",
-                "8e2b4b0943ae52720463257d67ec8fbf",
-            ],
-        ]
-    if doi == "20184525":
-        FILES_TO_CHECK = [
-            [
-                Path("annotations") / "combined__level-sample.bson",
-                "bb6db3b78fd7c143cf7de23911019729",
-            ],
-            [
-                Path("annotations") / "combined__level-series.bson",
-                "f19da03cb818c5c9146439f21c72a476",
-            ],
-            [
-                Path("metadata") / "metadata__level-sample.parquet",
-                "c13a4483f730739c2fd43b5c8fc06416",
-            ],
-            [
-                Path("metadata") / "metadata__level-series.parquet",
-                "bd6c597b8c66c74d367284e396f18864",
-            ],
-            [
-                Path("metadata") / "technologies.parquet",
-                "a7cd45dc7db09d30fe35676d8d449b32",
-            ],
-            [
-                Path("ontology") / "ontology_search.duckdb",
-                "14096af77a2080025cb64fb3a512c0c8",
-            ],
-            [
-                Path("ontology") / "mondo" / "id_map.parquet",
-                "37230bd391ec3af4be4f710ab2d76707",
-            ],
-            [
-                Path("ontology") / "mondo" / "names_synonyms.json",
-                "24318fa528ded695943b53787c0c7b00",
-            ],
-            [
-                Path("ontology") / "mondo" / "relations.parquet",
-                "743cb555c82752c19936471855a05c48",
-            ],
-            [
-                Path("ontology") / "mondo" / "systems.txt",
-                "dbf3e5566b4dd80e458b2cd5813ad693",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "id_map.parquet",
-                "a449bed0812bacfa35d9b83628da594e",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "names_synonyms.json",
-                "9e9fd448715929351e8c0e4b9561d56c",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "relations.parquet",
-                "41986e2e0cb31be122720b59f41bbe56",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "systems.txt",
-                "8e2b4b0943ae52720463257d67ec8fbf",
-            ],
-        ]
-    if doi == "18462463":
-        FILES_TO_CHECK = [
-            [
-                Path("annotations") / "combined__level-sample.bson",
-                "07c761c25eeb37787b13e3f0be7ea4db",
-            ],
-            [
-                Path("annotations") / "combined__level-series.bson",
-                "4a70f6c1a4cdd693cf33b50c561e960b",
-            ],
-            [
-                Path("metadata") / "metadata__level-sample.parquet",
-                "2527ffbc7b7bacd6054841b395975b8b",
-            ],
-            [
-                Path("metadata") / "metadata__level-series.parquet",
-                "0215ea97cf1e09e98a43d219b53b254f",
-            ],
-            [
-                Path("metadata") / "technologies.parquet",
-                "a7cd45dc7db09d30fe35676d8d449b32",
-            ],
-            [
-                Path("ontology") / "ontology_search.duckdb",
-                "5108270059472abc4a18e0ee3a7c68f2",
-            ],
-            [
-                Path("ontology") / "mondo" / "id_map.parquet",
-                "37230bd391ec3af4be4f710ab2d76707",
-            ],
-            [
-                Path("ontology") / "mondo" / "names_synonyms.json",
-                "24318fa528ded695943b53787c0c7b00",
-            ],
-            [
-                Path("ontology") / "mondo" / "relations.parquet",
-                "9d460ad0eaa06d85767717e2f6456163",
-            ],
-            [
-                Path("ontology") / "mondo" / "systems.txt",
-                "dbf3e5566b4dd80e458b2cd5813ad693",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "id_map.parquet",
-                "a449bed0812bacfa35d9b83628da594e",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "names_synonyms.json",
-                "9e9fd448715929351e8c0e4b9561d56c",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "relations.parquet",
-                "a9c3cead75ac43c2be3b961d69d25d53",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "systems.txt",
-                "8e2b4b0943ae52720463257d67ec8fbf",
-            ],
-        ]
-    if doi == "17666183":
-        FILES_TO_CHECK = [
-            [
-                Path("annotations") / "combined__level-sample.bson",
-                "5d41627b6194b34e19bda2edf9289b6d",
-            ],
-            [
-                Path("annotations") / "combined__level-series.bson",
-                "c4280f1432a001ebe031d6eb4d7b5c5c",
-            ],
-            [
-                Path("metadata") / "metadata__level-sample.parquet",
-                "5ab5771210d31f6cc3d81c29fec20a7e",
-            ],
-            [
-                Path("metadata") / "metadata__level-series.parquet",
-                "06629fd37a62905e79e31e8eaddf021d",
-            ],
-            [
-                Path("metadata") / "technologies.parquet",
-                "a7cd45dc7db09d30fe35676d8d449b32",
-            ],
-            [
-                Path("ontology") / "ontology_search.duckdb",
-                "5108270059472abc4a18e0ee3a7c68f2",
-            ],
-            [
-                Path("ontology") / "mondo" / "id_map.parquet",
-                "37230bd391ec3af4be4f710ab2d76707",
-            ],
-            [
-                Path("ontology") / "mondo" / "names_synonyms.json",
-                "24318fa528ded695943b53787c0c7b00",
-            ],
-            [
-                Path("ontology") / "mondo" / "relations.parquet",
-                "9d460ad0eaa06d85767717e2f6456163",
-            ],
-            [
-                Path("ontology") / "mondo" / "systems.txt",
-                "dbf3e5566b4dd80e458b2cd5813ad693",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "id_map.parquet",
-                "a449bed0812bacfa35d9b83628da594e",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "names_synonyms.json",
-                "9e9fd448715929351e8c0e4b9561d56c",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "relations.parquet",
-                "a9c3cead75ac43c2be3b961d69d25d53",
-            ],
-            [
-                Path("ontology") / "uberon_ext" / "systems.txt",
-                "b5327f3e6591768bcdb24b1b083cd0ea",
-            ],
-        ]
-    return FILES_TO_CHECK
+
+def get_files_to_check(doi: str) -> dict[str, str]:
+    """Return the expected checksum of each database file for a Zenodo DOI."""
+    if doi not in _MANIFESTS:
+        raise ValueError(
+            f"No checksums for database DOI {doi}. "
+            f"Expected one of {sorted(_MANIFESTS)}."
+        )
+    return _MANIFESTS[doi]
+
+
+# maximum number of files hashed concurrently
+MAX_HASH_WORKERS = 8
 
 
 def md5_file(filepath):
     """Calculate MD5 checksum of a file"""
-    hash_md5 = hashlib.md5()
-
     with open(filepath, "rb") as f:
-        # Read in chunks to handle large files efficiently
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-
-    return hash_md5.hexdigest()
+        # file_digest reads into a reusable buffer and releases the GIL while hashing
+        return hashlib.file_digest(f, "md5").hexdigest()
 
 
 def check_md5_match(config_doi, config_data_dir):
     """Check MD5 checksum match"""
     FILES_TO_CHECK = get_files_to_check(config_doi)
+    filepaths = [Path(config_data_dir) / relpath for relpath in FILES_TO_CHECK]
+
+    # hashlib releases the GIL, so threads hash files on separate cores
+    workers = min(MAX_HASH_WORKERS, os.cpu_count() or 1, len(filepaths))
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        new_checksums = pool.map(md5_file, filepaths)
+
     changed_files = []
-    for afile in FILES_TO_CHECK:
-        filepath = Path(config_data_dir) / afile[0]
-        new_checksum = md5_file(filepath)
-        old_checksum = afile[1]
+    for filepath, old_checksum, new_checksum in zip(
+        filepaths, FILES_TO_CHECK.values(), new_checksums
+    ):
         if new_checksum != old_checksum:
             changed_files.append(filepath)
     return changed_files
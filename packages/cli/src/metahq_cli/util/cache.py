@@ -0,0 +1,160 @@
+"""
+On-disk cache of curated retrieval results for `metahq retrieve --cache`.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import polars as pl
+from metahq_core.util.io import checkdir
+from metahq_core.util.supported import (
+    get_annotations,
+    get_database_version,
+    get_metahq_home,
+    get_ontology_families,
+    get_technologies,
+)
+
+if TYPE_CHECKING:
+    import logging
+
+    from metahq_core.curations.annotations import Annotations
+    from metahq_core.curations.labels import Labels
+
+    from metahq_cli.retriever import CurationConfig, QueryConfig
+
+
+def get_cache_dir() -> Path:
+    """Returns the directory storing cached retrieval results."""
+    return checkdir(get_metahq_home() / "cache")
+
+
+def retrieval_key(query_config: QueryConfig, curation_config: CurationConfig) -> str:
+    """Hashes the parameters and source files that determine a curated result.
+
+    Arguments:
+        query_config (QueryConfig):
+            Parameters for querying.
+
+        curation_config (CurationConfig):
+            Parameters for curating annotations.
+
+    Returns:
+        A hex digest that changes whenever the query, the curation, the database
+        version, or any source file the retrieval reads changes.
+    """
+    sources = [get_annotations(query_config.level), get_technologies()]
+    if curation_config.mode != "direct":
+        sources.append(get_ontology_families(curation_config.ontology)["relations"])
+
+    payload = {
+        "query": asdict(query_config),
+        "curation": asdict(curation_config),
+        "version": get_database_version(),
+        "sources": {str(file): file.stat().st_mtime_ns for file in sources},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def load_curation(
+    key: str, logger: logging.Logger, verbose: bool = True
+) -> Annotations | Labels | None:
+    """Loads a cached curation.
+
+    Arguments:
+        key (str):
+            Cache key from `retrieval_key`.
+
+        logger (logging.Logger):
+            Logger to attach to the loaded curation.
+
+        verbose (bool):
+            Verbosity of the loaded curation.
+
+    Returns:
+        The cached Annotations or Labels object, or None if `key` is not cached
+        or its entry cannot be read.
+    """
+    meta_file = get_cache_dir() / f"{key}.json"
+    if not meta_file.exists():
+        return None
+
+    from metahq_core.curations.annotations import Annotations
+    from metahq_core.curations.labels import Labels
+
+    try:
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        cls = {"annotations": Annotations, "labels": Labels}[meta["kind"]]
+
+        curation = cls(
+            data=pl.read_parquet(get_cache_dir() / f"{key}.data.parquet"),
+            ids=pl.read_parquet(get_cache_dir() / f"{key}.ids.parquet"),
+            index_col=meta["index_col"],
+            group_cols=tuple(meta["group_cols"]),
+            collapsed=meta["collapsed"],
+            logger=logger,
+            verbose=verbose,
+        )
+        curation.controls = meta["controls"]
+    except (OSError, ValueError, KeyError, pl.exceptions.PolarsError) as e:
+        logger.debug("Ignoring unreadable cache entry %s: %s", key, e)
+        return None
+
+    return curation
+
+
+def save_curation(curation: Annotations | Labels, key: str):
+    """Caches a curation under `key`.
+
+    Each file is written under a temporary name and moved into place, and the
+    metadata file is moved last so a partially written entry is never loaded.
+    An entry that is already complete is left as is.
+
+    Arguments:
+        curation (Annotations | Labels):
+            A curated Annotations or Labels object.
+
+        key (str):
+            Cache key from `retrieval_key`.
+    """
+    from metahq_core.curations.labels import Labels
+
+    cache_dir = get_cache_dir()
+    meta_file = cache_dir / f"{key}.json"
+    if meta_file.exists():
+        return
+
+    tmp = f"{os.getpid()}.tmp"
+    for name, df in (("data", curation.data), ("ids", curation.ids)):
+        file = cache_dir / f"{key}.{name}.parquet"
+        tmp_file = file.with_name(f"{file.name}.{tmp}")
+        df.write_parquet(tmp_file)
+        os.replace(tmp_file, file)
+
+    meta = {
+        "kind": "labels" if isinstance(curation, Labels) else "annotations",
+        "index_col": curation.index_col,
+        "group_cols": list(curation.group_cols),
+        "collapsed": curation.collapsed,
+        "controls": curation.controls,
+    }
+    meta_tmp = meta_file.with_name(f"{meta_file.name}.{tmp}")
+    meta_tmp.write_text(json.dumps(meta), encoding="utf-8")
+    os.replace(meta_tmp, meta_file)
+
+
+def clear_cache():
+    """Removes all cached retrieval results."""
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
@@ -16,16 +16,14 @@ from pathlib import Path
 from metahq_core.util.io import checkdir, load_txt
 from metahq_core.util.supported import supported
 
+from metahq_cli.util.helpers import split_terms
 from metahq_cli.util.messages import error
 from metahq_cli.util.supported import log_map, required_filters
 
 
 def check_filter_keys(filters: dict[str, str]):
-    unaccaptable = []
-    for f in filters:
-        if f not in required_filters():
-            unaccaptable.append(f)
-    return unaccaptable
+    acceptable = set(required_filters())
+    return [f for f in filters if f not in acceptable]
 
 
 def check_binary(file: Path | str) -> bool:
@@ -33,13 +31,15 @@ def check_binary(file: Path | str) -> bool:
         return b"\x00" in f.read(8000)
 
 
-def check_if_txt(string: str) -> list[str] | str:
-    if Path(string).is_file():
+def check_if_txt(string: str) -> list[str]:
+    """Return the terms in `string` or in the text file it names."""
+    # comma-separated terms are never a file path, so skip the filesystem probe
+    if "," not in string and Path(string).is_file():
         if check_binary(Path(string)):
             error(f"Detected binary file: {string}. Please write terms to text file.")
         return load_txt(string)
 
-    return string
+    return split_terms(string)
 
 
 def check_level(level: str):
@@ -14,6 +14,28 @@ from functools import wraps
 import click
 from metahq_core.util.supported import supported
 
+from metahq_cli.util.helpers import parse_filters
+
+
+class FiltersType(click.ParamType):
+    """Click type that parses `--filters` into a dictionary once, at option parsing."""
+
+    name = "filters"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, dict):
+            return value
+
+        try:
+            return parse_filters(value)
+        except ValueError:
+            self.fail(
+                f"Expected comma-separated key=value pairs, got {value!r}.", param, ctx
+            )
+
+
+AGE_GROUP_OPT = click.Choice(supported("age_groups") + ["all"])
+FILTERS_OPT = FiltersType()
 FMT_OPT = click.Choice(supported("formats"))
 LEVEL_OPT = click.Choice(supported("levels"))
 LICENSE_OPT = click.Choice(supported("licenses"))
@@ -48,7 +70,7 @@ def retrieval_args(command):
     )
     @click.option(
         "--filters",
-        type=str,
+        type=FILTERS_OPT,
         default="species=human,ecode=expert,tech=rnaseq",
         help="Filters for species, ecode, and technology. Run `metahq supported` for options.",
     )
@@ -71,6 +93,12 @@ def retrieval_args(command):
     )
     @click.option("--fmt", type=FMT_OPT, default="parquet")
     @click.option("--metadata", type=str, default="default")
+    @click.option(
+        "--cache",
+        is_flag=True,
+        default=False,
+        help="Reuse results of identical earlier retrievals, stored in ~/MetaHQ/cache.",
+    )
     @wraps(command)
     def wrapper(*args, **kwargs):
         return command(*args, **kwargs)
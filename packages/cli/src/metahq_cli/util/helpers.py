@@ -11,11 +11,26 @@ import os
 from pathlib import Path
 import json
 
-def set_verbosity(quiet: bool):
+def parse_filters(filters: str) -> dict[str, str]:
+    """Split a comma-delimited string of key=value filters into a dictionary.
+
+    Raises a ValueError if any filter is not a key=value pair.
+    """
+    parsed = {}
+    for f in filters.split(","):
+        key, sep, value = f.partition("=")
+        if not sep:
+            raise ValueError(f"Expected filter as key=value, got {f!r}.")
+        parsed[key] = value
+    return parsed
+
+def split_terms(terms: str) -> list[str]:
+    """Split comma-delimited terms, ignoring whitespace and empty entries."""
+    return [term for term in map(str.strip, terms.split(",")) if term]
+
+def set_verbosity(quiet: bool) -> bool:
     """Return the opposite of quiet."""
-    if quiet:
-        return False
-    return True
+    return not quiet
 
 def dir_to_nested_dict(path):
     """Get the rough directory sturcture of database, edit output for _validate.py"""
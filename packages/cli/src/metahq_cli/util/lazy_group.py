@@ -0,0 +1,48 @@
+"""
+Click group that imports subcommands only when they are requested.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group that resolves subcommands from import paths on first use.
+
+    Running `metahq <command>` only imports the module for that command rather
+    than every command module in the CLI.
+
+    Attributes:
+        lazy_subcommands (dict[str, str]):
+            Mapping of command names to `module.attribute` import paths of the
+            click commands they resolve to.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        command = getattr(importlib.import_module(module_name), attr)
+
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of {self.lazy_subcommands[cmd_name]} failed by "
+                f"returning a non-command object."
+            )
+        return command
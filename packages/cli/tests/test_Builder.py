@@ -129,6 +129,17 @@ class TestBuilder:
         assert result["tech"] == "microarray"
         assert len(result) == 3
 
+    @patch("metahq_cli.retrieval_builder.required_filters")
+    def test_parse_filters_accepts_parsed_filters(self, mock_required, builder):
+        """test _parse_filters checks filters already parsed by the --filters option"""
+        mock_required.return_value = ["species", "ecode", "tech"]
+        filters = {"species": "human", "ecode": "expert", "tech": "rnaseq"}
+
+        assert builder._parse_filters(filters) == filters
+
+        with pytest.raises(RuntimeError):
+            builder._parse_filters({"species": "human"})
+
     @patch("metahq_cli.retrieval_builder.check_filter")
     @patch("metahq_cli.retrieval_builder.check_license")
     def test_query_config_creates_config(self, mock_check_license, mock_check, builder):
@@ -246,9 +257,12 @@ class TestBuilder:
         mock_check_keys.return_value = ["bad_filter"]
         filters = {"bad_filter": "value"}
 
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError) as exc_info:
             builder.report_bad_filters(filters)
 
+        assert str(exc_info.value).startswith("Expected filters in")
+        assert "bad_filter" in str(exc_info.value)
+
     @patch("metahq_cli.retrieval_builder.check_filter_keys")
     def test_report_bad_filters_logs_error_when_verbose(
         self, mock_check_keys, verbose_builder
@@ -266,9 +280,9 @@ class TestBuilder:
     @patch("metahq_cli.retrieval_builder.check_mode")
     def test_make_sex_curation_with_all(self, mock_check_mode, mock_check_txt, builder):
         """test make_sex_curation with 'all' returns all sexes"""
-        mock_check_txt.return_value = "all"
+        mock_check_txt.return_value = ["all"]
 
-        with patch("metahq_core.util.supported.sexes") as mock_sexes:
+        with patch("metahq_cli.retrieval_builder.sexes") as mock_sexes:
             mock_sexes.return_value = ["M", "F"]
             result = builder.make_sex_curation("all", "direct")
 
@@ -284,7 +298,7 @@ class TestBuilder:
         self, mock_check_mode, mock_check_txt, builder
     ):
         """test make_sex_curation with comma-separated string"""
-        mock_check_txt.return_value = "male,female"
+        mock_check_txt.return_value = ["male", "female"]
 
         result = builder.make_sex_curation("male,female", "direct")
 
@@ -297,7 +311,7 @@ class TestBuilder:
     @patch("metahq_cli.retrieval_builder.check_mode")
     def test_make_age_curation_with_all(self, mock_check_mode, mock_check_txt, builder):
         """test make_age_curation with 'all' returns all age groups"""
-        mock_check_txt.return_value = "all"
+        mock_check_txt.return_value = ["all"]
 
         with patch("metahq_core.util.supported._age_groups") as mock_age_groups:
             mock_age_groups.return_value = [
@@ -332,7 +346,7 @@ class TestBuilder:
         self, mock_check_mode, mock_check_txt, builder
     ):
         """test make_age_curation with comma-separated string"""
-        mock_check_txt.return_value = "fetus,adult"
+        mock_check_txt.return_value = ["fetus", "adult"]
 
         result = builder.make_age_curation("fetus,adult", "direct")
 
@@ -369,10 +383,8 @@ class TestBuilder:
 
             result = builder.curation_config("all", "direct", "uberon")
 
-            # parse_onto_terms is called twice: once for "all", once for the result
-            assert mock_parse.call_count == 2
-            mock_parse.assert_any_call("all", "uberon")
-            mock_parse.assert_any_call(["UBERON:0000001", "UBERON:0000002"], "uberon")
+            # "all" already resolves to schema terms, so they are not re-parsed
+            mock_parse.assert_called_once_with("all", "uberon")
             assert result.terms == ["UBERON:0000001", "UBERON:0000002"]
             assert result.ontology == "uberon"
 
@@ -381,7 +393,7 @@ class TestBuilder:
         self, mock_check_txt, builder
     ):
         """test curation_config handles comma-separated terms for regular ontologies"""
-        mock_check_txt.return_value = "UBERON:0000001,UBERON:0000002"
+        mock_check_txt.return_value = ["UBERON:0000001", "UBERON:0000002"]
 
         with patch.object(builder, "parse_onto_terms") as mock_parse:
             mock_parse.return_value = ["UBERON:0000001", "UBERON:0000002"]
@@ -414,14 +426,39 @@ class TestBuilder:
 
         assert result == []
 
-    @patch("metahq_cli.retrieval_builder.pl.scan_parquet")
-    def test_parse_onto_terms_raises_when_no_results(self, mock_scan, builder):
+    def test_parse_accepts_set_of_available_terms(self, builder):
+        """test _parse filters against a set of available terms"""
+        terms = ["term3", "term1", "term2"]
+        available = {"term1", "term3"}
+
+        result = builder._parse(terms, available)
+
+        assert result == ["term3", "term1"]
+
+    @patch("metahq_cli.retrieval_builder.relation_terms")
+    def test_parse_onto_terms_reports_missing_in_input_order(
+        self, mock_terms, verbose_builder
+    ):
+        """test parse_onto_terms reports missing terms once, in the order given"""
+        mock_terms.return_value = ["UBERON:0000001"]
+
+        with patch("metahq_cli.retrieval_builder.get_ontology_families") as mock_get:
+            mock_get.return_value = {"relations": "path/to/relations.parquet"}
+
+            verbose_builder.parse_onto_terms(
+                ["MONDO:0000003", "UBERON:0000001", "MONDO:0000001", "MONDO:0000003"],
+                "uberon",
+            )
+
+            verbose_builder.log.warning.assert_called_once_with(
+                "No annotations for input terms: %s",
+                ["MONDO:0000003", "MONDO:0000001"],
+            )
+
+    @patch("metahq_cli.retrieval_builder.relation_terms")
+    def test_parse_onto_terms_raises_when_no_results(self, mock_terms, builder):
         """test parse_onto_terms raises NoResultsFound when no terms match"""
-        mock_schema = Mock()
-        mock_schema.names.return_value = ["UBERON:0000001", "UBERON:0000002"]
-        mock_lazyframe = Mock()
-        mock_lazyframe.collect_schema.return_value = mock_schema
-        mock_scan.return_value = mock_lazyframe
+        mock_terms.return_value = ["UBERON:0000001", "UBERON:0000002"]
 
         with patch("metahq_cli.retrieval_builder.get_ontology_families") as mock_get:
             mock_get.return_value = {"relations": "path/to/relations.parquet"}
@@ -431,14 +468,21 @@ class TestBuilder:
 
             assert "have no annotations" in str(exc_info.value)
 
-    @patch("metahq_cli.retrieval_builder.pl.scan_parquet")
-    def test_parse_onto_terms_logs_error_when_verbose(self, mock_scan, verbose_builder):
+    @patch("metahq_cli.retrieval_builder.relation_terms")
+    def test_parse_onto_terms_raises_on_empty_terms(self, mock_terms, builder):
+        """test parse_onto_terms fails on no terms before reading the relations"""
+        with pytest.raises(NoResultsFound) as exc_info:
+            builder.parse_onto_terms([], "uberon")
+
+        assert "No UBERON terms" in str(exc_info.value)
+        mock_terms.assert_not_called()
+
+    @patch("metahq_cli.retrieval_builder.relation_terms")
+    def test_parse_onto_terms_logs_error_when_verbose(
+        self, mock_terms, verbose_builder
+    ):
         """test parse_onto_terms logs error in verbose mode when no results"""
-        mock_schema = Mock()
-        mock_schema.names.return_value = ["UBERON:0000001"]
-        mock_lazyframe = Mock()
-        mock_lazyframe.collect_schema.return_value = mock_schema
-        mock_scan.return_value = mock_lazyframe
+        mock_terms.return_value = ["UBERON:0000001"]
 
         with patch("metahq_cli.retrieval_builder.get_ontology_families") as mock_get:
             mock_get.return_value = {"relations": "path/to/relations.parquet"}
@@ -448,16 +492,12 @@ class TestBuilder:
 
             verbose_builder.log.error.assert_called_once()
 
-    @patch("metahq_cli.retrieval_builder.pl.scan_parquet")
+    @patch("metahq_cli.retrieval_builder.relation_terms")
     def test_parse_onto_terms_logs_warning_for_partial_match(
-        self, mock_scan, verbose_builder
+        self, mock_terms, verbose_builder
     ):
         """test parse_onto_terms logs warning when some terms don't match"""
-        mock_schema = Mock()
-        mock_schema.names.return_value = ["UBERON:0000001", "UBERON:0000002"]
-        mock_lazyframe = Mock()
-        mock_lazyframe.collect_schema.return_value = mock_schema
-        mock_scan.return_value = mock_lazyframe
+        mock_terms.return_value = ["UBERON:0000001", "UBERON:0000002"]
 
         with patch("metahq_cli.retrieval_builder.get_ontology_families") as mock_get:
             mock_get.return_value = {"relations": "path/to/relations.parquet"}
@@ -469,14 +509,10 @@ class TestBuilder:
             assert result == ["UBERON:0000001"]
             verbose_builder.log.warning.assert_called_once()
 
-    @patch("metahq_cli.retrieval_builder.pl.scan_parquet")
-    def test_parse_onto_terms_no_warning_when_silent(self, mock_scan, builder):
+    @patch("metahq_cli.retrieval_builder.relation_terms")
+    def test_parse_onto_terms_no_warning_when_silent(self, mock_terms, builder):
         """test parse_onto_terms doesn't log in silent mode"""
-        mock_schema = Mock()
-        mock_schema.names.return_value = ["UBERON:0000001"]
-        mock_lazyframe = Mock()
-        mock_lazyframe.collect_schema.return_value = mock_schema
-        mock_scan.return_value = mock_lazyframe
+        mock_terms.return_value = ["UBERON:0000001"]
 
         with patch("metahq_cli.retrieval_builder.get_ontology_families") as mock_get:
             mock_get.return_value = {"relations": "path/to/relations.parquet"}
@@ -488,14 +524,10 @@ class TestBuilder:
             assert result == ["UBERON:0000001"]
             builder.log.warning.assert_not_called()
 
-    @patch("metahq_cli.retrieval_builder.pl.scan_parquet")
-    def test_parse_onto_terms_handles_all_keyword(self, mock_scan, builder):
+    @patch("metahq_cli.retrieval_builder.relation_terms")
+    def test_parse_onto_terms_handles_all_keyword(self, mock_terms, builder):
         """test parse_onto_terms handles 'all' keyword correctly"""
-        mock_schema = Mock()
-        mock_schema.names.return_value = ["UBERON:0000001", "UBERON:0000002"]
-        mock_lazyframe = Mock()
-        mock_lazyframe.collect_schema.return_value = mock_schema
-        mock_scan.return_value = mock_lazyframe
+        mock_terms.return_value = ["UBERON:0000001", "UBERON:0000002"]
 
         with patch("metahq_cli.retrieval_builder.get_ontology_families") as mock_get:
             mock_get.return_value = {"relations": "path/to/relations.parquet"}
@@ -505,3 +537,16 @@ class TestBuilder:
             assert "UBERON:0000002" in result
             # UBERON:0000003 is not in available list, so should not be included
             assert "UBERON:0000003" not in result
+
+    @patch("metahq_cli.retrieval_builder.relation_terms")
+    def test_parse_onto_terms_reads_relations_terms(self, mock_terms, builder):
+        """test parse_onto_terms checks terms against the ontology relations file"""
+        mock_terms.return_value = ["UBERON:0000001", "UBERON:0000002"]
+
+        with patch("metahq_cli.retrieval_builder.get_ontology_families") as mock_get:
+            mock_get.return_value = {"relations": "path/to/relations.parquet"}
+            result = builder.parse_onto_terms(["UBERON:0000002"], "uberon")
+
+            assert result == ["UBERON:0000002"]
+            mock_get.assert_called_once_with("uberon")
+            mock_terms.assert_called_once_with("path/to/relations.parquet")
@@ -7,6 +7,7 @@ Date: 2025-11-21
 Last updated: 2025-11-21 by Parker Hicks
 """
 
+import json
 import tarfile
 from unittest.mock import MagicMock, Mock, patch
 
@@ -286,7 +287,7 @@ class TestDownloader:
         mock_response.headers = {"content-length": "1048576"}
         mock_response.status_code = 200
 
-        with patch("metahq_cli.setup.downloader.requests.head") as mock_head:
+        with patch.object(downloader._session, "head") as mock_head:
             mock_head.return_value = mock_response
 
             downloader.get_stats()
@@ -300,7 +301,7 @@ class TestDownloader:
         mock_response.headers = {"content-length": "0"}
         mock_response.status_code = 200
 
-        with patch("metahq_cli.setup.downloader.requests.head") as mock_head:
+        with patch.object(verbose_downloader._session, "head") as mock_head:
             mock_head.return_value = mock_response
 
             verbose_downloader.get_stats()
@@ -316,7 +317,7 @@ class TestDownloader:
         mock_response.status_code = 200
         mock_response.url = "https://zenodo.org/test"
 
-        with patch("metahq_cli.setup.downloader.requests.head") as mock_head:
+        with patch.object(verbose_downloader._session, "head") as mock_head:
             mock_head.return_value = mock_response
 
             verbose_downloader.get_stats()
@@ -359,7 +360,7 @@ class TestDownloader:
         mock_response = Mock()
         mock_response.iter_content.return_value = [b"chunk1", b"chunk2"]
 
-        with patch("metahq_cli.setup.downloader.requests.get") as mock_get:
+        with patch.object(downloader._session, "get") as mock_get:
             mock_get.return_value = mock_response
 
             downloader._download_no_progress()
@@ -375,7 +376,7 @@ class TestDownloader:
         downloader.config.filesize = 12
 
         with (
-            patch("metahq_cli.setup.downloader.requests.get") as mock_get,
+            patch.object(downloader._session, "get") as mock_get,
             patch("metahq_cli.setup.downloader.progress_bar") as mock_progress_bar,
         ):
             mock_get.return_value = mock_response
@@ -389,6 +390,161 @@ class TestDownloader:
             mock_progress_bar.assert_called_once_with(padding="    ")
             mock_progress.add_task.assert_called_once()
 
+    @staticmethod
+    def _ranged_get(payload):
+        """Build a Session.get side effect serving byte ranges of payload."""
+
+        def get(url, headers, **kwargs):
+            start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+            response = Mock()
+            response.status_code = 206
+            response.iter_content.return_value = [payload[start : end + 1]]
+            return response
+
+        return get
+
+    def test_get_stats_detects_range_support(self, downloader):
+        """Test get_stats enables ranged downloads when the server accepts them."""
+        mock_response = Mock()
+        mock_response.headers = {"content-length": "10", "accept-ranges": "bytes"}
+        mock_response.status_code = 200
+
+        with patch.object(downloader._session, "head") as mock_head:
+            mock_head.return_value = mock_response
+
+            downloader.get_stats()
+
+            assert downloader._accepts_ranges is True
+
+    def test_download_ranges_writes_all_parts(self, downloader):
+        """Test _download_ranges assembles the file from concurrent byte ranges."""
+        payload = bytes(range(100))
+        downloader.config.filesize = len(payload)
+        advance = Mock()
+
+        with (
+            patch("metahq_cli.setup.downloader.MIN_PART_SIZE", 16),
+            patch.object(downloader._session, "get") as mock_get,
+        ):
+            mock_get.side_effect = self._ranged_get(payload)
+
+            downloader._download_ranges(advance)
+
+            assert mock_get.call_count == 7
+
+        assert downloader.config.outfile.read_bytes() == payload
+        assert not downloader.config.parts_file.exists()
+        assert sum(call.args[0] for call in advance.call_args_list) == len(payload)
+
+    def test_download_ranges_resumes_completed_parts(self, downloader):
+        """Test _download_ranges only fetches ranges missing from a prior attempt."""
+        payload = bytes(range(100))
+        downloader.config.filesize = len(payload)
+        downloader.config.outfile.write_bytes(payload[:32] + bytes(68))
+        downloader.config.parts_file.write_text("[0, 16]")
+
+        with (
+            patch("metahq_cli.setup.downloader.MIN_PART_SIZE", 16),
+            patch.object(downloader._session, "get") as mock_get,
+        ):
+            mock_get.side_effect = self._ranged_get(payload)
+
+            downloader._download_ranges(Mock())
+
+            requested = {
+                call.kwargs["headers"]["Range"] for call in mock_get.call_args_list
+            }
+            assert "bytes=0-15" not in requested
+            assert "bytes=16-31" not in requested
+            assert mock_get.call_count == 5
+
+        assert downloader.config.outfile.read_bytes() == payload
+
+    def test_download_ranges_retries_only_failed_part(self, downloader):
+        """Test a byte range that fails mid-stream is retried on its own."""
+        payload = bytes(range(100))
+        downloader.config.filesize = len(payload)
+        advance = Mock()
+        serve = self._ranged_get(payload)
+        failed = []
+
+        def get(url, headers, **kwargs):
+            response = serve(url, headers, **kwargs)
+            if headers["Range"] == "bytes=16-31" and not failed:
+                failed.append(True)
+
+                def broken(chunk_size):
+                    yield payload[16:20]
+                    raise requests.exceptions.ChunkedEncodingError()
+
+                response.iter_content.side_effect = broken
+            return response
+
+        with (
+            patch("metahq_cli.setup.downloader.MIN_PART_SIZE", 16),
+            patch.object(downloader._session, "get") as mock_get,
+        ):
+            mock_get.side_effect = get
+
+            downloader._download_ranges(advance)
+
+            requested = [
+                call.kwargs["headers"]["Range"] for call in mock_get.call_args_list
+            ]
+            assert requested.count("bytes=16-31") == 2
+            assert len(requested) == 8
+
+        assert downloader.config.outfile.read_bytes() == payload
+        assert sum(call.args[0] for call in advance.call_args_list) == len(payload)
+
+    def test_download_ranges_records_parts_before_failure(self, downloader):
+        """Test completed ranges survive a failed attempt and are not fetched again."""
+        payload = bytes(range(100))
+        downloader.config.filesize = len(payload)
+        serve = self._ranged_get(payload)
+
+        def get(url, headers, **kwargs):
+            if not headers["Range"].startswith("bytes=0-"):
+                raise requests.exceptions.ConnectionError()
+            return serve(url, headers, **kwargs)
+
+        with (
+            patch("metahq_cli.setup.downloader.MIN_PART_SIZE", 16),
+            patch("metahq_cli.setup.downloader.DOWNLOAD_THREADS", 1),
+            patch.object(downloader._session, "get") as mock_get,
+        ):
+            mock_get.side_effect = get
+
+            with pytest.raises(requests.exceptions.ConnectionError):
+                downloader._download_ranges(Mock())
+
+            assert json.loads(downloader.config.parts_file.read_text()) == [0]
+
+            mock_get.reset_mock(side_effect=True)
+            mock_get.side_effect = serve
+
+            downloader._download_ranges(Mock())
+
+            requested = [
+                call.kwargs["headers"]["Range"] for call in mock_get.call_args_list
+            ]
+            assert not any(r.startswith("bytes=0-") for r in requested)
+
+        assert downloader.config.outfile.read_bytes() == payload
+
+    def test_download_part_rejects_full_response(self, downloader):
+        """Test _download_part fails when the server ignores the Range header."""
+        downloader.config.filesize = 10
+        downloader.config.outfile.write_bytes(bytes(10))
+        mock_response = Mock()
+        mock_response.status_code = 200
+
+        with patch.object(downloader._session, "get") as mock_get:
+            mock_get.return_value = mock_response
+
+            with pytest.raises(RuntimeError):
+                downloader._download_part(0, 9, Mock())
+
     # ========================================
     # ======  get method error handling tests
     # ========================================
@@ -411,6 +567,25 @@ class TestDownloader:
 
             mock_raise.assert_called_once()
 
+    def test_get_closes_session(self, downloader):
+        """Test get closes the HTTP session even when the download fails."""
+        with (
+            patch.object(downloader, "check_outdir_exists"),
+            patch.object(
+                downloader,
+                "get_stats",
+                side_effect=requests.exceptions.ConnectionError(),
+            ),
+            patch.object(downloader, "_raise_connection_error") as mock_raise,
+            patch.object(downloader._session, "close") as mock_close,
+        ):
+            mock_raise.side_effect = SystemExit(1)
+
+            with pytest.raises(SystemExit):
+                downloader.get()
+
+            mock_close.assert_called_once()
+
     def test_get_handles_timeout_error(self, downloader):
         """Test get handles Timeout error correctly."""
         with (
@@ -605,6 +780,15 @@ class TestDownloader:
         downloader.logger.error.assert_called()
         downloader.logger.info.assert_called()
 
+    def test_raise_keyboard_interrupt_removes_parts_file(self, downloader):
+        """Test _raise_keyboard_interrupt removes the ranged download record."""
+        downloader.config.parts_file.write_text("[0]")
+
+        with pytest.raises(SystemExit):
+            downloader._raise_keyboard_interrupt()
+
+        assert not downloader.config.parts_file.exists()
+
     def test_raise_keyboard_interrupt_no_partial_file(self, downloader):
         """Test _raise_keyboard_interrupt handles case when no partial file exists."""
         with pytest.raises(SystemExit) as exc_info:
@@ -0,0 +1,85 @@
+"""
+Unit tests for LazyGroup class.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from metahq_cli.util.lazy_group import LazyGroup
+
+
+class TestLazyGroup:
+    """test lazy subcommand loading"""
+
+    @pytest.fixture
+    def group(self):
+        """fixture for a group with one lazy and one eager command"""
+
+        @click.group(
+            cls=LazyGroup,
+            lazy_subcommands={"lazy": "metahq_cli.commands.supported.supported"},
+        )
+        def cli():
+            pass
+
+        @cli.command("eager")
+        def eager():
+            pass
+
+        return cli
+
+    def test_list_commands_includes_lazy_and_eager(self, group):
+        """test lazy commands are listed alongside regular commands"""
+        ctx = click.Context(group)
+        assert group.list_commands(ctx) == ["eager", "lazy"]
+
+    def test_get_command_imports_lazy_command(self, group):
+        """test lazy commands resolve to the click command at the import path"""
+        ctx = click.Context(group)
+        command = group.get_command(ctx, "lazy")
+
+        assert isinstance(command, click.Command)
+        assert command is sys.modules["metahq_cli.commands.supported"].supported
+
+    def test_get_command_unknown_returns_none(self, group):
+        """test unknown commands fall through to click"""
+        ctx = click.Context(group)
+        assert group.get_command(ctx, "missing") is None
+
+    def test_get_command_rejects_non_command(self):
+        """test import paths that are not click commands raise"""
+        group = LazyGroup(
+            lazy_subcommands={"bad": "metahq_cli.util.helpers.set_verbosity"}
+        )
+
+        with pytest.raises(ValueError):
+            group.get_command(click.Context(group), "bad")
+
+    def test_main_help_lists_commands(self):
+        """test the CLI entry point lists every command"""
+        from metahq_cli.main import main
+
+        result = CliRunner().invoke(main, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ["delete", "retrieve", "search", "setup", "supported", "validate"]:
+            assert name in result.output
+
+    def test_commands_resolve_after_dispatch(self):
+        """test every command still resolves once another command has run"""
+        from metahq_cli.main import main
+
+        result = CliRunner().invoke(main, ["supported", "--help"])
+        assert result.exit_code == 0
+
+        ctx = click.Context(main)
+        for name in main.list_commands(ctx):
+            assert isinstance(main.get_command(ctx, name), click.Command)
@@ -311,6 +311,29 @@ class TestRetriever:
         _, kwargs = mock_query_class.call_args
         assert kwargs["license"] == "permissive"
 
+    @patch("metahq_cli.retriever.Query")
+    def test_query_passes_terms_in_direct_mode(self, mock_query_class, retriever):
+        """direct mode restricts the core query to the requested terms."""
+        mock_query = Mock()
+        mock_query_class.return_value = mock_query
+
+        retriever.query()
+
+        mock_query.annotations.assert_called_once_with(terms=["term1", "term2"])
+
+    @patch("metahq_cli.retriever.Query")
+    def test_query_passes_no_terms_when_propagating(
+        self, mock_query_class, retriever
+    ):
+        """propagating modes need every term, so the query is not restricted."""
+        retriever.curation_config.mode = "annotate"
+        mock_query = Mock()
+        mock_query_class.return_value = mock_query
+
+        retriever.query()
+
+        mock_query.annotations.assert_called_once_with(terms=None)
+
     def test_curate_raises_error_when_no_annotations(self, retriever):
         """test curate raises NoResultsFound when there are no annotations"""
         mock_annotations = Mock()
@@ -548,6 +571,64 @@ class TestRetriever:
         mock_curate.assert_called_once_with(mock_annotations)
         mock_save.assert_called_once_with(mock_curated)
 
+    @patch("metahq_cli.retriever.save_curation")
+    @patch("metahq_cli.retriever.load_curation")
+    @patch("metahq_cli.retriever.retrieval_key")
+    @patch.object(Retriever, "query")
+    @patch.object(Retriever, "save_curation")
+    def test_retrieve_uses_cached_curation(
+        self, mock_save, mock_query, mock_key, mock_load, mock_cache_save, retriever
+    ):
+        """test retrieve skips query and curate when the result is cached"""
+        retriever.cache = True
+        mock_key.return_value = "key"
+        mock_load.return_value = Mock()
+
+        retriever.retrieve()
+
+        mock_query.assert_not_called()
+        mock_cache_save.assert_not_called()
+        mock_save.assert_called_once_with(mock_load.return_value)
+
+    @patch("metahq_cli.retriever.save_curation")
+    @patch("metahq_cli.retriever.load_curation")
+    @patch("metahq_cli.retriever.retrieval_key")
+    @patch.object(Retriever, "query")
+    @patch.object(Retriever, "curate")
+    @patch.object(Retriever, "save_curation")
+    def test_retrieve_caches_new_curation(
+        self,
+        mock_save,
+        mock_curate,
+        mock_query,
+        mock_key,
+        mock_load,
+        mock_cache_save,
+        retriever,
+    ):
+        """test retrieve caches the curation when no cached result exists"""
+        retriever.cache = True
+        mock_key.return_value = "key"
+        mock_load.return_value = None
+
+        retriever.retrieve()
+
+        mock_query.assert_called_once()
+        mock_cache_save.assert_called_once_with(mock_curate.return_value, "key")
+        mock_save.assert_called_once_with(mock_curate.return_value)
+
+    @patch("metahq_cli.retriever.retrieval_key")
+    @patch.object(Retriever, "query")
+    @patch.object(Retriever, "curate")
+    @patch.object(Retriever, "save_curation")
+    def test_retrieve_without_cache_skips_key(
+        self, mock_save, mock_curate, mock_query, mock_key, retriever
+    ):
+        """test the cache is not consulted unless requested"""
+        retriever.retrieve()
+
+        mock_key.assert_not_called()
+
     @pytest.mark.parametrize(
         "mode,expected_mode",
         [
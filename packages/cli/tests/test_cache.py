@@ -0,0 +1,182 @@
+"""
+Unit tests for the retrieval result cache.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import polars as pl
+import pytest
+from metahq_core.curations.annotations import Annotations
+from metahq_core.curations.labels import Labels
+
+from metahq_cli.retriever import CurationConfig, QueryConfig
+from metahq_cli.util.cache import (
+    clear_cache,
+    load_curation,
+    retrieval_key,
+    save_curation,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path):
+    """point the cache to a temporary directory"""
+    with patch("metahq_cli.util.cache.get_cache_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """fixture for source files the retrieval reads"""
+    files = {}
+    for name in ("annotations.bson", "technologies.parquet", "relations.parquet"):
+        files[name] = tmp_path / name
+        files[name].write_text(name)
+
+    with (
+        patch(
+            "metahq_cli.util.cache.get_annotations",
+            return_value=files["annotations.bson"],
+        ),
+        patch(
+            "metahq_cli.util.cache.get_technologies",
+            return_value=files["technologies.parquet"],
+        ),
+        patch(
+            "metahq_cli.util.cache.get_ontology_families",
+            return_value={"relations": files["relations.parquet"]},
+        ),
+        patch("metahq_cli.util.cache.get_database_version", return_value="v1"),
+    ):
+        yield files
+
+
+@pytest.fixture
+def annotations():
+    """fixture for a small curated Annotations object"""
+    return Annotations(
+        data=pl.DataFrame({"UBERON:0000948": [1, 0], "UBERON:0000955": [0, 1]}),
+        ids=pl.DataFrame({"sample": ["GSM1", "GSM2"], "series": ["GSE1", "GSE2"]}),
+        index_col="sample",
+        group_cols=("series",),
+        logger=Mock(),
+    )
+
+
+@pytest.fixture
+def query_config():
+    return QueryConfig("geo", "tissue", "sample", "expert", "human", "rnaseq")
+
+
+class TestRetrievalKey:
+    """test cache keys"""
+
+    def test_key_is_stable(self, sources, query_config):
+        """test identical retrievals share a key"""
+        curation = CurationConfig("annotate", ["UBERON:0000948"], "uberon")
+
+        assert retrieval_key(query_config, curation) == retrieval_key(
+            query_config, curation
+        )
+
+    def test_key_changes_with_terms(self, sources, query_config):
+        """test different terms produce a different key"""
+        first = CurationConfig("annotate", ["UBERON:0000948"], "uberon")
+        second = CurationConfig("annotate", ["UBERON:0000955"], "uberon")
+
+        assert retrieval_key(query_config, first) != retrieval_key(query_config, second)
+
+    def test_key_changes_when_source_is_modified(self, sources, query_config):
+        """test rewriting a source file invalidates the key"""
+        curation = CurationConfig("annotate", ["UBERON:0000948"], "uberon")
+        before = retrieval_key(query_config, curation)
+
+        stat = sources["relations.parquet"].stat()
+        os.utime(
+            sources["relations.parquet"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1)
+        )
+
+        assert retrieval_key(query_config, curation) != before
+
+
+class TestCuration:
+    """test saving and loading cached curations"""
+
+    def test_missing_key_returns_none(self):
+        """test uncached keys load as None"""
+        assert load_curation("missing", logger=Mock()) is None
+
+    @pytest.mark.parametrize("cls", [Annotations, Labels])
+    def test_round_trip(self, cls):
+        """test a cached curation loads with the same data and attributes"""
+        curation = cls(
+            data=pl.DataFrame({"UBERON:0000948": [1, 0], "UBERON:0000955": [0, 1]}),
+            ids=pl.DataFrame({"sample": ["GSM1", "GSM2"], "series": ["GSE1", "GSE2"]}),
+            index_col="sample",
+            group_cols=("series",),
+            logger=Mock(),
+        )
+
+        save_curation(curation, "key")
+        loaded = load_curation("key", logger=Mock(), verbose=False)
+
+        assert isinstance(loaded, cls)
+        assert loaded.data.equals(curation.data)
+        assert loaded.ids.equals(curation.ids)
+        assert loaded.index_col == "sample"
+        assert loaded.group_cols == ("series",)
+        assert loaded.collapsed is False
+
+    def test_save_leaves_no_temporary_files(self, annotations, cache_dir):
+        """test saving moves every file into place"""
+        save_curation(annotations, "key")
+
+        assert sorted(f.name for f in cache_dir.iterdir()) == [
+            "key.data.parquet",
+            "key.ids.parquet",
+            "key.json",
+        ]
+
+    def test_save_keeps_complete_entry(self, annotations, cache_dir):
+        """test an existing entry is not rewritten"""
+        save_curation(annotations, "key")
+        mtime = (cache_dir / "key.data.parquet").stat().st_mtime_ns
+
+        with patch.object(pl.DataFrame, "write_parquet") as mock_write:
+            save_curation(annotations, "key")
+
+        mock_write.assert_not_called()
+        assert (cache_dir / "key.data.parquet").stat().st_mtime_ns == mtime
+
+    @pytest.mark.parametrize(
+        "file, content",
+        [
+            ("key.data.parquet", b"PAR1 truncated"),
+            ("key.ids.parquet", None),
+            ("key.json", b"{not json"),
+            ("key.json", b'{"kind": "other"}'),
+        ],
+    )
+    def test_damaged_entry_returns_none(self, annotations, cache_dir, file, content):
+        """test an unreadable entry is treated as a cache miss"""
+        save_curation(annotations, "key")
+        if content is None:
+            (cache_dir / file).unlink()
+        else:
+            (cache_dir / file).write_bytes(content)
+
+        assert load_curation("key", logger=Mock()) is None
+
+    def test_clear_cache(self, annotations, cache_dir):
+        """test clearing removes cached entries"""
+        save_curation(annotations, "key")
+
+        clear_cache()
+
+        assert not cache_dir.exists()
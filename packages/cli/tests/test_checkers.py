@@ -0,0 +1,39 @@
+"""
+Unit tests for CLI checker functions.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+from unittest.mock import patch
+
+from metahq_cli.util.checkers import check_if_txt
+
+
+class TestCheckIfTxt:
+    """test reading terms from a string or a text file"""
+
+    def test_comma_separated_terms_skip_filesystem(self):
+        """test comma-separated terms are returned without probing the filesystem"""
+        with patch("metahq_cli.util.checkers.Path") as mock_path:
+            result = check_if_txt("UBERON:0000948,UBERON:0000955")
+
+        assert result == ["UBERON:0000948", "UBERON:0000955"]
+        mock_path.assert_not_called()
+
+    def test_single_term_is_returned_as_list(self):
+        """test a single term that is not a file is returned as a one-item list"""
+        assert check_if_txt("UBERON:0000948") == ["UBERON:0000948"]
+
+    def test_ignores_blank_terms(self):
+        """test stray commas and whitespace do not produce empty terms"""
+        assert check_if_txt("adult, child,,") == ["adult", "child"]
+
+    def test_reads_terms_from_file(self, tmp_path):
+        """test terms are loaded from a text file path"""
+        file = tmp_path / "terms.txt"
+        file.write_text("UBERON:0000948\nUBERON:0000955\n")
+
+        assert check_if_txt(str(file)) == ["UBERON:0000948", "UBERON:0000955"]
@@ -0,0 +1,55 @@
+"""
+Unit tests for common CLI argument types.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from metahq_cli.util.common_args import FiltersType, retrieval_args
+
+
+class TestFiltersType:
+    """test parsing of the --filters option"""
+
+    def test_convert_parses_string(self):
+        """test key=value pairs are parsed to a dictionary"""
+        result = FiltersType().convert(
+            "species=human,ecode=expert,tech=rnaseq", None, None
+        )
+
+        assert result == {"species": "human", "ecode": "expert", "tech": "rnaseq"}
+
+    def test_convert_passes_dict_through(self):
+        """test already parsed filters are returned unchanged"""
+        filters = {"species": "human"}
+
+        assert FiltersType().convert(filters, None, None) is filters
+
+    def test_convert_rejects_malformed_filters(self):
+        """test filters without a value fail with a usage error"""
+        with pytest.raises(click.BadParameter):
+            FiltersType().convert("species=human,ecode", None, None)
+
+    def test_convert_keeps_equals_in_values(self):
+        """test only the first '=' separates a filter key from its value"""
+        assert FiltersType().convert("species=a=b", None, None) == {"species": "a=b"}
+
+    def test_default_filters_are_parsed(self):
+        """test the default --filters value reaches commands as a dictionary"""
+        received = {}
+
+        @click.command()
+        @retrieval_args
+        def command(filters, **kwargs):
+            received.update(filters)
+
+        result = CliRunner().invoke(command, [])
+
+        assert result.exit_code == 0
+        assert received == {"species": "human", "ecode": "expert", "tech": "rnaseq"}
@@ -0,0 +1,33 @@
+"""
+Unit tests for the CLI logger.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+from rich.console import Console
+
+from metahq_cli.logger import setup_logger
+
+
+def test_loggers_share_handlers(tmp_path):
+    """test loggers for the same console and log directory reuse one set of handlers"""
+    console = Console()
+    first = setup_logger("test_logger.first", console=console, log_dir=tmp_path)
+    second = setup_logger("test_logger.second", console=console, log_dir=tmp_path)
+
+    assert first.handlers == second.handlers
+    assert len(first.handlers) == 2
+
+
+def test_file_log_has_no_console_markup(tmp_path):
+    """test console color markup does not leak into the log file"""
+    logger = setup_logger("test_logger.markup", console=Console(), log_dir=tmp_path)
+    logger.warning("careful")
+    for handler in logger.handlers:
+        handler.flush()
+
+    assert "[WARNING] careful" in (tmp_path / "log.log").read_text()
+    assert "[yellow]" not in (tmp_path / "log.log").read_text()
@@ -0,0 +1,46 @@
+"""
+Unit tests for database file validation.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from metahq_cli.util._validate import check_md5_match, get_files_to_check, md5_file
+
+
+def test_md5_file(tmp_path):
+    """test md5_file matches hashlib's digest of the file contents"""
+    file = tmp_path / "data.bin"
+    file.write_bytes(b"metahq" * 10000)
+
+    assert md5_file(file) == hashlib.md5(b"metahq" * 10000).hexdigest()
+
+
+def test_check_md5_match_reports_changed_files(tmp_path):
+    """test only files whose checksum differs are reported, in manifest order"""
+    contents = {"a.txt": b"a", "b.txt": b"b", "c.txt": b"c"}
+    for name, content in contents.items():
+        (tmp_path / name).write_bytes(content)
+
+    manifest = {
+        "a.txt": hashlib.md5(b"a").hexdigest(),
+        "b.txt": hashlib.md5(b"changed").hexdigest(),
+        "c.txt": hashlib.md5(b"changed").hexdigest(),
+    }
+    with patch("metahq_cli.util._validate.get_files_to_check", return_value=manifest):
+        changed = check_md5_match("doi", tmp_path)
+
+    assert changed == [tmp_path / "b.txt", tmp_path / "c.txt"]
+
+
+def test_get_files_to_check_rejects_unknown_doi():
+    """test an unknown database DOI raises a clear error"""
+    with pytest.raises(ValueError, match="No checksums for database DOI"):
+        get_files_to_check("0000000")
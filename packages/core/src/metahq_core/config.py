@@ -9,3 +9,10 @@ Last updated: 2026-04-13 by Parker Hicks
 
 # name of the column containing sources in a query result
 SOURCES_COL = "sources"
+
+# rows per row group when exporting curations to parquet. Smaller groups than
+# the polars default let readers skip more of the file using row group statistics
+PARQUET_ROW_GROUP_SIZE = 65_536
+
+# smallest row group used when splitting small exports so they can be read in parallel
+PARQUET_MIN_ROW_GROUP_SIZE = 1_024
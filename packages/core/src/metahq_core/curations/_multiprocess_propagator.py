@@ -9,7 +9,6 @@ Last updated: 2025-11-18 by Parker Hicks
 
 from __future__ import annotations
 
-import multiprocessing as mp
 import os
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
@@ -18,6 +17,7 @@ import numpy as np
 
 from metahq_core.logger import setup_logger
 from metahq_core.util.alltypes import NpIntMatrix
+from metahq_core.util.helpers import available_cpus
 from metahq_core.util.progress import progress_bar
 
 if TYPE_CHECKING:
@@ -47,7 +47,7 @@ class MultiprocessPropagator:
         This is the function split between workers.
         """
         chunk_idx, chunk, family = args
-        result = np.einsum("ij,jk->ik", chunk, family)
+        result = chunk @ family
 
         return chunk_idx, result
 
@@ -61,7 +61,7 @@ class MultiprocessPropagator:
     ):
         """Multiprocessing propagation"""
         if n_processes is None:
-            n_processes = mp.cpu_count() - 1
+            n_processes = max(1, available_cpus() - 1)
 
         final_shape = (
             n_indices,
@@ -69,6 +69,10 @@ class MultiprocessPropagator:
         )
 
         propagated = np.empty(final_shape, dtype=np.int32)
+
+        # match the float32 annotation chunks so the product runs through BLAS
+        # rather than upcasting every chunk. Sums of 0/1 entries are exact in float32.
+        family = np.asarray(family, dtype=np.float32)
         args_list = [(i, chunk, family) for i, chunk in enumerate(split)]
 
         executor = (
@@ -4,7 +4,7 @@ Class for storing and mutating annotation collections.
 Author: Parker Hicks
 Date: 2025-04-14
 
-Last updated: 2026-04-13 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 from __future__ import annotations
@@ -165,9 +165,8 @@ class Annotations(BaseCuration):
         """
         mask = self.data.select(condition.arg_true()).to_numpy().reshape(-1)
 
-        filtered_data = (
-            self.data.with_row_index().filter(pl.col("index").is_in(mask)).drop("index")
-        )
+        # gather rows by position instead of matching a row index against the mask
+        filtered_data = self.data[mask]
         filtered_ids = self._ids.filter_by_mask(mask)
 
         return self.__class__(
@@ -187,7 +186,7 @@ class Annotations(BaseCuration):
     def save(
         self,
         outfile: str | Path,
-        fmt: Literal["json", "parquet", "csv", "tsv"],
+        fmt: Literal["json", "parquet", "arrow", "csv", "tsv"],
         attribute: str,
         level: str,
         citation_config: CitationConfig,
@@ -199,7 +198,7 @@ class Annotations(BaseCuration):
             outfile (str | Path):
                 Path to outfile.json.
 
-            fmt (Literal["json", "parquet", "csv", "tsv"]):
+            fmt (Literal["json", "parquet", "arrow", "csv", "tsv"]):
                 File format to save to.
 
             attribute (str):
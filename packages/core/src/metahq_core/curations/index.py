@@ -4,7 +4,7 @@ Class to store and operate on indices for tabular data.
 Author: Parker Hicks
 Date: 2025-08-13
 
-Last updated: 2025-11-28 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 from __future__ import annotations
@@ -63,12 +63,7 @@ class Ids:
             │ GSM3   ┆ GSE2   ┆ GPL23    │
             └────────┴────────┴──────────┘
         """
-        filtered_data = (
-            self.data.with_row_index(name="tmp_idx")
-            .filter(pl.col("tmp_idx").is_in(mask))
-            .drop("tmp_idx")
-        )
-        return Ids(filtered_data, self.index_col)
+        return Ids(self.data[mask], self.index_col)
 
     def lazy(self) -> pl.LazyFrame:
         """Wrapper for `polars.DataFrame.lazy()`.
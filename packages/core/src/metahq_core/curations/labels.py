@@ -4,7 +4,7 @@ Class for mutating and operating on sets of labels.
 Author: Parker Hicks
 Date: 2025-08-13
 
-Last updated: 2026-04-13 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 from __future__ import annotations
@@ -132,9 +132,8 @@ class Labels(BaseCuration):
         """
         mask = self.data.select(condition.arg_true()).to_numpy().reshape(-1)
 
-        filtered_data = (
-            self.data.with_row_index().filter(pl.col("index").is_in(mask)).drop("index")
-        )
+        # gather rows by position instead of matching a row index against the mask
+        filtered_data = self.data[mask]
         filtered_ids = self._ids.filter_by_mask(mask)
 
         return self.__class__(
@@ -154,7 +153,7 @@ class Labels(BaseCuration):
     def save(
         self,
         outfile: str | Path,
-        fmt: Literal["json", "parquet", "csv", "tsv"],
+        fmt: Literal["json", "parquet", "arrow", "csv", "tsv"],
         attribute: str,
         level: str,
         citation_config: CitationConfig,
@@ -166,7 +165,7 @@ class Labels(BaseCuration):
             outfile (str | Path):
                 Path to outfile.json.
 
-            fmt (Literal["json", "parquet", "csv", "tsv"]):
+            fmt (Literal["json", "parquet", "arrow", "csv", "tsv"]):
                 File format to save to.
 
             attribute (str):
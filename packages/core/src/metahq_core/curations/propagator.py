@@ -30,6 +30,7 @@ import polars as pl
 
 from metahq_core.curations._multiprocess_propagator import MultiprocessPropagator
 from metahq_core.logger import setup_logger
+from metahq_core.relations_loader import relation_terms
 from metahq_core.util.alltypes import NpIntMatrix, NpStringArray
 from metahq_core.util.supported import get_default_log_dir, onto_relations
 
@@ -156,17 +157,15 @@ class Propagator:
 
     def _load_family_ids(self) -> NpStringArray:
         """Loads the term IDs of the relations DataFrame."""
-        tmp = (
-            pl.scan_parquet(onto_relations(self.ontology, "relations"))
-            .collect_schema()
-            .names()
-        )
-        return np.array([term for term in tmp if term in self.to])
+        to = set(self.to)
+        tmp = relation_terms(onto_relations(self.ontology, "relations"))
+        return np.array([term for term in tmp if term in to])
 
     def _load_relatives(self, relatives: str) -> NpIntMatrix:
         """Loads the relationships matrix between ontology terms."""
-        lf = pl.scan_parquet(onto_relations(self.ontology, "relations"))
-        all_terms = pl.Series("terms", lf.collect_schema().names())
+        file = onto_relations(self.ontology, "relations")
+        lf = pl.scan_parquet(file)
+        all_terms = pl.Series("terms", relation_terms(file))
 
         self.anno = self.anno.sort_columns()
         _from = self.anno.data.columns
@@ -18,15 +18,8 @@ from metahq_core.config import SOURCES_COL
 from metahq_core.export.base import BaseExporter
 from metahq_core.export.references import CitationConfig, save_citations
 from metahq_core.logger import setup_logger
-from metahq_core.util.io import checkdir, load_bson, save_json
-from metahq_core.util.supported import (
-    database_ids,
-    geo_metadata,
-    get_annotations,
-    get_default_log_dir,
-    metadata_fields,
-    supported,
-)
+from metahq_core.util.io import checkdir, save_json
+from metahq_core.util.supported import database_ids, get_default_log_dir
 
 if TYPE_CHECKING:
     import logging
@@ -72,7 +65,6 @@ class AnnotationsExporter(BaseExporter):
         verbose=True,
     ):
         self.attribute = attribute
-        self._database = self._load_annotations(level)
 
         if logger is None:
             logger = setup_logger(__name__, level=loglevel, log_dir=logdir)
@@ -115,7 +107,7 @@ class AnnotationsExporter(BaseExporter):
     def save(
         self,
         anno: Annotations,
-        fmt: Literal["json", "parquet", "csv", "tsv"],
+        fmt: Literal["json", "parquet", "arrow", "csv", "tsv"],
         file: FilePath,
         citation_config: CitationConfig,
         metadata: str | None = None,
@@ -128,7 +120,7 @@ class AnnotationsExporter(BaseExporter):
             anno (Annotations):
                 A populated Annotations object.
 
-            fmt (Literal["json", "parquet", "csv", "tsv"]):
+            fmt (Literal["json", "parquet", "arrow", "csv", "tsv"]):
                 File format to save to.
 
             file (FilePath):
@@ -145,6 +137,7 @@ class AnnotationsExporter(BaseExporter):
         opt = {
             "json": self.to_json,
             "parquet": self.to_parquet,
+            "arrow": self.to_arrow,
             "csv": self.to_csv,
             "tsv": self.to_tsv,
         }
@@ -154,6 +147,29 @@ class AnnotationsExporter(BaseExporter):
         if self.verbose:
             self.log.info("Saved!")
 
+    def to_arrow(
+        self,
+        anno: Annotations,
+        file: FilePath,
+        citation_config: CitationConfig,
+        metadata: str | None = None,
+        **kwargs,
+    ):
+        """Save annotations to an Arrow IPC file.
+
+        Arguments:
+            anno (Annotations):
+                A populated Annotations object.
+
+            file (FilePath):
+                Path to outfile.arrow.
+
+            metadata (str | None):
+                Metadata fields to include.
+
+        """
+        self._save_tabular("arrow", anno, file, citation_config, metadata, **kwargs)
+
     def to_csv(
         self,
         anno: Annotations,
@@ -261,83 +277,11 @@ class AnnotationsExporter(BaseExporter):
         """
         self._save_tabular("tsv", anno, file, citation_config, metadata, **kwargs)
 
-    def _get_descriptions(self, anno: Annotations):
-        """Collect descriptions to add the final output."""
-        representative = anno.ids.row(0, named=True)[anno.index_col]
-        if representative.startswith("GSM"):
-            level = "sample"
-        elif representative.startswith("GSE"):
-            level = "series"
-        else:
-            msg = "Congratulations! You broke the application. Please submit an issue."
-            if self.verbose:
-                self.log.error(msg)
-                self.log.debug(
-                    "%s was used to identify if the passed level is sample or series",
-                    representative,
-                )
-            raise RuntimeError(msg)
-
-        return (
-            pl.scan_parquet(geo_metadata(level))
-            .select([level, "description"])
-            .filter(pl.col(level).is_in(anno.index))
-            .rename({level: anno.index_col})
-            .collect()
-        )
-
-    def _get_save_method(self, fmt: str):
-        """Returns appropriate saving method."""
-        opt = {
-            "parquet": self._save_parquet,
-            "csv": self._save_csv,
-            "tsv": self._save_tsv,
-        }
-        if fmt in opt:
-            return opt[fmt]
-
-        msg = ("Expected fmt in %s, got %s.", list(opt.keys()), fmt)
-        if self.verbose:
-            self.log.error(msg)
-        raise ValueError(msg)
-
-    def _load_annotations(self, level: str) -> dict:
-        """Load the annotations dictionary for a given level."""
-        if level == "sample":
-            return load_bson(get_annotations("sample"))
-
-        if level == "series":
-            return load_bson(get_annotations("series"))
-
-        msg = ("Expected annotations level in %s, got %s.", supported("levels"), level)
-        if self.verbose:
-            self.log.error(msg)
-        raise ValueError(msg)
-
-    def _parse_metafields(self, index_col, fields: str) -> list[str]:
-        """Parse and check user-specified metadata fields."""
-        _metadata = fields.split(",")
-
-        flagged = False
-        for field in _metadata:
-            if field not in metadata_fields(index_col):
-                flagged = True
-                self.log.warning(
-                    "Requested metadata: %s, is not available. Skipping...", field
-                )
-
-        if flagged:
-            self.log.info("Run `metahq supported` to see available metadata fields.")
-
-        if not index_col in _metadata:
-            _metadata.append(index_col)
-        return _metadata
-
     def _save_table_with_description(
         self, file: FilePath, anno: Annotations, metadata: list[str], fmt: str, **kwargs
     ):
         """Fetches corresponding sample/study descriptions and saves the annotations
-        curation in tabular format (parquet, csv, tsv).
+        curation in tabular format (parquet, arrow, csv, tsv).
         """
 
         desc = self._get_descriptions(anno)
@@ -397,24 +341,12 @@ class AnnotationsExporter(BaseExporter):
                 anno.ids.select(_metadata).hstack(anno.data), file, **kwargs
             )
 
-    def _sra_in_metadata(self, metadata: list[str]) -> bool:
-        """Checks if any SRA IDs are in requested metadata."""
-        return len(list(set(metadata) & set(database_ids("sra")))) > 0
-
     def _only_index(self, metadata: str | None, index: str):
         """Check if no metadata passed or if only the index is passed."""
         return (metadata is None) or (
             isinstance(metadata, str) & (metadata.strip().replace(",", "") == index)
         )
 
-    def _save_parquet(self, df: pl.DataFrame, file: FilePath, **kwargs):
-        """Save polars DataFrame to parquet."""
-        df.write_parquet(file, **kwargs)
-
-    def _save_csv(self, df: pl.DataFrame, file: FilePath, **kwargs):
-        """Save polars DataFrame to csv/tsv."""
-        df.write_csv(file, **kwargs, separator=",")
-
     def _save_json_only_index(self, anno: Annotations, file: FilePath):
         """Save annotations as JSON with only the index."""
         self.log.info("Saving retrieval result to %s", file)
@@ -471,10 +403,6 @@ class AnnotationsExporter(BaseExporter):
 
         save_json(_anno, file)
 
-    def _save_tsv(self, df: pl.DataFrame, file: FilePath, **kwargs):
-        """Save polars DataFrame to csv/tsv."""
-        df.write_csv(file, **kwargs, separator="\t")
-
     def _write_row(
         self, row: dict[str, str], anno: dict[str, list[str]], index_col: str
     ):
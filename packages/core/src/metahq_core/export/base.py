@@ -4,7 +4,7 @@ Abstract base class for Curation export io classes.
 Author: Parker Hicks
 Date: 2025-09-08
 
-Last updated: 2025-09-08 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
 from __future__ import annotations
@@ -12,14 +12,33 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+import polars as pl
+
+from metahq_core.config import PARQUET_MIN_ROW_GROUP_SIZE, PARQUET_ROW_GROUP_SIZE
+from metahq_core.util.io import load_bson_cached
+from metahq_core.util.supported import (
+    database_ids,
+    geo_metadata,
+    get_annotations,
+    metadata_fields,
+    supported,
+)
+
 if TYPE_CHECKING:
+    import logging
 
     from metahq_core.curations.base import BaseCuration
     from metahq_core.util.alltypes import FilePath, NpIntMatrix
 
 
 class BaseExporter(ABC):
-    """Base abstract class for Exporter children."""
+    """Base abstract class for Exporter children.
+
+    Children set `log` and `verbose`, which the shared helpers below rely on.
+    """
+
+    log: logging.Logger
+    verbose: bool
 
     @abstractmethod
     def to_json(
@@ -42,6 +61,12 @@ class BaseExporter(ABC):
     ):
         """Saves curation to parquet."""
 
+    @abstractmethod
+    def to_arrow(
+        self, curation: BaseCuration, file: FilePath, metadata: str | None, **kwargs
+    ):
+        """Saves curation to an Arrow IPC file."""
+
     @abstractmethod
     def to_csv(
         self,
@@ -61,3 +86,116 @@ class BaseExporter(ABC):
         **kwargs,
     ):
         """Saves curation to tsv."""
+
+    def _save_parquet(self, df: pl.DataFrame, file: FilePath, **kwargs):
+        """Save polars DataFrame to parquet.
+
+        Writes zstd-compressed row groups with statistics. Row groups hold at most
+        `PARQUET_ROW_GROUP_SIZE` rows, and smaller results are split into about four
+        groups so they can still be read in parallel.
+        """
+        kwargs.setdefault("compression", "zstd")
+        kwargs.setdefault("compression_level", 3)
+        kwargs.setdefault("statistics", True)
+        kwargs.setdefault(
+            "row_group_size",
+            min(
+                PARQUET_ROW_GROUP_SIZE,
+                max(PARQUET_MIN_ROW_GROUP_SIZE, df.height // 4),
+            ),
+        )
+        df.write_parquet(file, **kwargs)
+
+    def _save_arrow(self, df: pl.DataFrame, file: FilePath, **kwargs):
+        """Save polars DataFrame to an Arrow IPC file.
+
+        Written uncompressed by default so downstream readers such as `pl.scan_ipc`
+        can map the file without a decompression step.
+        """
+        kwargs.setdefault("compression", "uncompressed")
+        df.write_ipc(file, **kwargs)
+
+    def _save_csv(self, df: pl.DataFrame, file: FilePath, **kwargs):
+        """Save polars DataFrame to csv."""
+        df.write_csv(file, **kwargs, separator=",")
+
+    def _save_tsv(self, df: pl.DataFrame, file: FilePath, **kwargs):
+        """Save polars DataFrame to tsv."""
+        df.write_csv(file, **kwargs, separator="\t")
+
+    def _get_save_method(self, fmt: str):
+        """Returns appropriate saving method."""
+        opt = {
+            "parquet": self._save_parquet,
+            "arrow": self._save_arrow,
+            "csv": self._save_csv,
+            "tsv": self._save_tsv,
+        }
+        if fmt in opt:
+            return opt[fmt]
+
+        msg = ("Expected fmt in %s, got %s.", list(opt.keys()), fmt)
+        if self.verbose:
+            self.log.error(msg)
+        raise ValueError(msg)
+
+    def _get_descriptions(self, curation: BaseCuration) -> pl.DataFrame:
+        """Collect descriptions to add the final output."""
+        representative = curation.ids.row(0, named=True)[curation.index_col]
+        if representative.startswith("GSM"):
+            level = "sample"
+        elif representative.startswith("GSE"):
+            level = "series"
+        else:
+            msg = "Congratulations! You broke the application. Please submit an issue."
+            if self.verbose:
+                self.log.error(msg)
+                self.log.debug(
+                    "%s was used to identify if the passed level is sample or series",
+                    representative,
+                )
+            raise RuntimeError(msg)
+
+        return (
+            pl.scan_parquet(geo_metadata(level))
+            .select([level, "description"])
+            .filter(pl.col(level).is_in(curation.ids[curation.index_col].implode()))
+            .rename({level: curation.index_col})
+            .collect()
+        )
+
+    def _load_annotations(self, level: str) -> dict:
+        """Load the annotations dictionary for a given level."""
+        if level == "sample":
+            return load_bson_cached(get_annotations("sample"))
+
+        if level == "series":
+            return load_bson_cached(get_annotations("series"))
+
+        msg = ("Expected annotations level in %s, got %s.", supported("levels"), level)
+        if self.verbose:
+            self.log.error(msg)
+        raise ValueError(msg)
+
+    def _parse_metafields(self, index_col, fields: str) -> list[str]:
+        """Parse and check user-specified metadata fields."""
+        _metadata = fields.split(",")
+
+        flagged = False
+        for field in _metadata:
+            if field not in metadata_fields(index_col):
+                flagged = True
+                self.log.warning(
+                    "Requested metadata: %s, is not available. Skipping...", field
+                )
+
+        if flagged:
+            self.log.info("Run `metahq supported` to see available metadata fields.")
+
+        if not index_col in _metadata:
+            _metadata.append(index_col)
+        return _metadata
+
+    def _sra_in_metadata(self, metadata: list[str]) -> bool:
+        """Checks if any SRA IDs are in requested metadata."""
+        return len(list(set(metadata) & set(database_ids("sra")))) > 0
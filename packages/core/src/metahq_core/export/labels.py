@@ -18,15 +18,11 @@ from metahq_core.config import SOURCES_COL
 from metahq_core.export.base import BaseExporter
 from metahq_core.export.references import CitationConfig, save_citations
 from metahq_core.logger import setup_logger
-from metahq_core.util.io import checkdir, load_bson, save_json
+from metahq_core.util.io import checkdir, save_json
 from metahq_core.util.supported import (
     database_ids,
     disease_ontologies,
-    geo_metadata,
-    get_annotations,
     get_default_log_dir,
-    metadata_fields,
-    supported,
 )
 
 if TYPE_CHECKING:
@@ -73,7 +69,6 @@ class LabelsExporter(BaseExporter):
         verbose=True,
     ):
         self.attribute = attribute
-        self._database = self._load_annotations(level)
 
         if logger is None:
             logger = setup_logger(__name__, level=loglevel, log_dir=logdir)
@@ -118,7 +113,7 @@ class LabelsExporter(BaseExporter):
     def save(
         self,
         labels: Labels,
-        fmt: Literal["json", "parquet", "csv", "tsv"],
+        fmt: Literal["json", "parquet", "arrow", "csv", "tsv"],
         file: FilePath,
         citation_config: CitationConfig,
         metadata: str | None = None,
@@ -131,7 +126,7 @@ class LabelsExporter(BaseExporter):
             labels (Labels):
                 A populated Labels curation object.
 
-            fmt (Literal["json", "parquet", "csv", "tsv"]):
+            fmt (Literal["json", "parquet", "arrow", "csv", "tsv"]):
                 File format to save to.
 
             file (FilePath):
@@ -148,6 +143,7 @@ class LabelsExporter(BaseExporter):
         opt = {
             "json": self.to_json,
             "parquet": self.to_parquet,
+            "arrow": self.to_arrow,
             "csv": self.to_csv,
             "tsv": self.to_tsv,
         }
@@ -156,6 +152,29 @@ class LabelsExporter(BaseExporter):
         if self.verbose:
             self.log.info("Saved!")
 
+    def to_arrow(
+        self,
+        curation: Labels,
+        file: FilePath,
+        citation_config: CitationConfig,
+        metadata: str | None = None,
+        **kwargs,
+    ):
+        """Save labels to an Arrow IPC file.
+
+        Arguments:
+            curation (Labels):
+                A populated Labels curation object.
+
+            file (FilePath):
+                Path to outfile.arrow.
+
+            metadata (str | None):
+                Metadata fields to include.
+
+        """
+        self._save_tabular("arrow", curation, file, citation_config, metadata, **kwargs)
+
     def to_csv(
         self,
         curation: Labels,
@@ -313,84 +332,12 @@ class LabelsExporter(BaseExporter):
         """
         self._save_tabular("tsv", curation, file, citation_config, metadata, **kwargs)
 
-    def _get_descriptions(self, labels: Labels):
-        """Collect descriptions to add the final output."""
-        representative = labels.ids.row(0, named=True)[labels.index_col]
-        if representative.startswith("GSM"):
-            level = "sample"
-        elif representative.startswith("GSE"):
-            level = "series"
-        else:
-            msg = "Congratulations! You broke the application. Please submit an issue."
-            if self.verbose:
-                self.log.error(msg)
-                self.log.debug(
-                    "%s was used to identify if the passed level is sample or series",
-                    representative,
-                )
-            raise RuntimeError(msg)
-
-        return (
-            pl.scan_parquet(geo_metadata(level))
-            .select([level, "description"])
-            .filter(pl.col(level).is_in(labels.index))
-            .rename({level: labels.index_col})
-            .collect()
-        )
-
-    def _get_save_method(self, fmt: str):
-        """Returns appropriate saving method."""
-        opt = {
-            "parquet": self._save_parquet,
-            "csv": self._save_csv,
-            "tsv": self._save_tsv,
-        }
-        if fmt in opt:
-            return opt[fmt]
-
-        msg = ("Expected fmt in %s, got %s.", list(opt.keys()), fmt)
-        if self.verbose:
-            self.log.error(msg)
-        raise ValueError(msg)
-
-    def _load_annotations(self, level: str) -> dict:
-        """Load the annotations dictionary for a given level."""
-        if level == "sample":
-            return load_bson(get_annotations("sample"))
-
-        if level == "series":
-            return load_bson(get_annotations("series"))
-
-        msg = ("Expected annotations level in %s, got %s.", supported("levels"), level)
-        if self.verbose:
-            self.log.error(msg)
-        raise ValueError(msg)
-
-    def _parse_metafields(self, index_col, fields: str) -> list[str]:
-        """Parse and check user-specified metadata fields."""
-        _metadata = fields.split(",")
-
-        flagged = False
-        for field in _metadata:
-            if field not in metadata_fields(index_col):
-                flagged = True
-                self.log.warning(
-                    "Requested metadata: %s, is not available. Skipping...", field
-                )
-
-        if flagged:
-            self.log.info("Run `metahq supported` to see available metadata fields.")
-
-        if not index_col in _metadata:
-            _metadata.append(index_col)
-        return _metadata
-
     def _save_table_with_description(
         self, file: FilePath, labels: Labels, metadata: list[str], fmt: str, **kwargs
     ):
         """
         Fetches corresponding sample/study descriptions and saves the labels
-        curation in tabular format (parquet, csv, tsv).
+        curation in tabular format (parquet, arrow, csv, tsv).
         """
 
         desc = self._get_descriptions(labels)
@@ -455,22 +402,6 @@ class LabelsExporter(BaseExporter):
                 **kwargs,
             )
 
-    def _save_parquet(self, df: pl.DataFrame, file: FilePath, **kwargs):
-        """Save polars DataFrame to parquet."""
-        df.write_parquet(file, **kwargs)
-
-    def _save_csv(self, df: pl.DataFrame, file: FilePath, **kwargs):
-        """Save polars DataFrame to csv/tsv."""
-        df.write_csv(file, **kwargs, separator=",")
-
-    def _save_tsv(self, df: pl.DataFrame, file: FilePath, **kwargs):
-        """Save polars DataFrame to csv/tsv."""
-        df.write_csv(file, **kwargs, separator="\t")
-
-    def _sra_in_metadata(self, metadata: list[str]) -> bool:
-        """Checks if any SRA IDs are in requested metadata."""
-        return len(list(set(metadata) & set(database_ids("sra")))) > 0
-
     def _write_row(self, row: dict[str, str], labels: dict[str, dict], index_col: str):
         """Write a row of an Annotations curation to a dictionary."""
         idx = row[index_col]
@@ -16,7 +16,7 @@ from metahq_core.curations.annotations import Annotations
 from metahq_core.logger import setup_logger
 from metahq_core.sources import get_allowed_sources
 from metahq_core.util.exceptions import NoResultsFound
-from metahq_core.util.io import load_bson
+from metahq_core.util.io import load_bson_cached
 from metahq_core.util.supported import (
     _ecodes,
     attributes,
@@ -160,6 +160,7 @@ class LongAnnotations:
         level: Literal["sample", "series"],
         anchor: Literal["id", "value"],
         id_cols: list[str],
+        terms: list[str] | None = None,
     ) -> pl.DataFrame:
         """Pivots the to wide annotations with one-hot-encoded binary entries for
         each annotation.
@@ -174,6 +175,11 @@ class LongAnnotations:
             id_cols (list[str]):
                 Columns to keep as IDs when pivoting.
 
+            terms (list[str] | None):
+                If provided, only these annotations are pivoted to columns and entries
+                without any of them are dropped. Filtering the long format first avoids
+                building a column for every annotation in the database.
+
         Returns:
             Annotations in one-hot-encoded wide format with the accession IDs for each annotation.
 
@@ -214,11 +220,16 @@ class LongAnnotations:
 
         # pivot to wide format
         exploded = (
-            self.annotations.with_columns(pl.col(anchor).str.split("|").alias(anchor))
+            self.annotations.lazy()
+            .with_columns(pl.col(anchor).str.split("|").alias(anchor))
             .explode(anchor)
-            .unique(maintain_order=True)
         )
 
+        if terms is not None:
+            exploded = exploded.filter(pl.col(anchor).is_in(terms))
+
+        exploded = exploded.unique(maintain_order=True).collect()
+
         one_hot = (
             exploded.pivot(
                 index=level,
@@ -493,7 +504,9 @@ class Query:
         self.log: logging.Logger = logger
         self.verbose: bool = verbose
 
-    def annotations(self, anchor: Literal["id", "value"] = "id") -> Annotations:
+    def annotations(
+        self, anchor: Literal["id", "value"] = "id", terms: list[str] | None = None
+    ) -> Annotations:
         """Retrieve annotations from the MetaHQ database.
 
         Arguments:
@@ -503,6 +516,10 @@ class Query:
                 predetermined age groups for the age attribute. Using `value` will return
                 annotations with the free text names for each id.
 
+            terms (list[str] | None):
+                Restrict the annotations to these terms. Entries without any of the terms
+                are excluded. If None, all annotations are returned.
+
         Returns:
             An `Annotations` object with one-hot-encoded annotations to the specified attribute.
 
@@ -524,7 +541,7 @@ class Query:
         # construct the annotations
         attr_anno = self.compile_annotations(id_cols)
         attr_anno = LongAnnotations(attr_anno).pivot_wide(
-            self.level, anchor, id_cols + [SOURCES_COL]
+            self.level, anchor, id_cols + [SOURCES_COL], terms=terms
         )
 
         na_cols = list(set(attr_anno.columns) & set(na_entities()))
@@ -648,7 +665,7 @@ class Query:
 
     def _load_annotations(self):
         """Loads the MetaHQ database for the specified level."""
-        anno = load_bson(get_annotations(self.level))
+        anno = load_bson_cached(get_annotations(self.level))
 
         return anno
 
@@ -656,6 +673,7 @@ class Query:
         return list(
             pl.scan_parquet(get_technologies())
             .filter(pl.col("technology") == self.technology)
+            .select("id")
             .collect()["id"]
         )
 
@@ -15,6 +15,7 @@ Date: 2025-11-17
 Last updated: 2025-11-21 by Parker Hicks
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 import polars as pl
@@ -28,6 +29,32 @@ ROW_ID: str = "row_id"
 COL_ID: str = "col_id"
 
 
+def relation_terms(file: str | Path) -> list[str]:
+    """Term IDs of a relations DataFrame in row/column order.
+
+    The schema of the relations file is cached for as long as the file is unchanged,
+    so repeated propagations within a process only read the Parquet footer once.
+
+    Parameters
+    ----------
+    file: str | Path
+        Path to a terms x terms relations .parquet file.
+
+    Returns
+    -------
+    The column names of the relations file.
+
+    """
+    path = Path(file)
+    return list(_relation_terms(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _relation_terms(file: str, mtime_ns: int) -> tuple[str, ...]:
+    """Cached reader for `relation_terms`. `mtime_ns` is only part of the cache key."""
+    return tuple(pl.scan_parquet(file).collect_schema().names())
+
+
 class RelationsLoader:
     """Loader for the MetaHQ data package ontology relations DataFrames.
 
@@ -62,7 +89,7 @@ class RelationsLoader:
         lf = pl.scan_parquet(file)
 
         try:
-            return lf.with_columns(pl.Series(ROW_ID, lf.collect_schema().names()))
+            return lf.with_columns(pl.Series(ROW_ID, relation_terms(file)))
 
         except pl.exceptions.PolarsError as e:
             self.logger.error(e)
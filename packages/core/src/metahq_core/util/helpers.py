@@ -1,5 +1,6 @@
 import functools
 import operator
+import os
 from typing import Any
 
 from metahq_core.util.alltypes import StringArray
@@ -34,3 +35,14 @@ def merge_list_values(dict_: dict[str, list[str]]):
     for value in dict_.values():
         merged.extend(value)
     return merged
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process is allowed to run on.
+
+    Respects CPU affinity (e.g., a SLURM allocation or `taskset`) where the platform
+    exposes it, unlike `os.cpu_count` which reports every CPU on the machine.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
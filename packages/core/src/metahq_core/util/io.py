@@ -4,19 +4,22 @@ Input/output functions.
 Author: Parker Hicks
 Date: 2025-04
 
-Last updated: 2026-04-10 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
+from __future__ import annotations
+
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
 from bson import BSON
 
-from metahq_core.util.alltypes import StringArray
+if TYPE_CHECKING:
+    from metahq_core.util.alltypes import StringArray
 
 
 def checkdir(path: str | Path, is_file: bool = False) -> Path:
@@ -53,6 +56,26 @@ def load_bson(file: str | Path, **kwargs) -> dict[str, Any]:
         return BSON(bf.read()).decode(**kwargs)
 
 
+def load_bson_cached(file: str | Path) -> dict[str, Any]:
+    """Load dictionary from compressed BSON, reusing the result for unchanged files.
+
+    Intended for the read-only MetaHQ annotations databases, which are decoded by both
+    the query and the exporters during a single retrieval. Do not mutate the result.
+
+    Arguments:
+        file (str | Path):
+            Path to file.bson to load.
+    """
+    path = Path(file)
+    return _load_bson_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=2)
+def _load_bson_cached(file: str, mtime_ns: int) -> dict[str, Any]:
+    """Cached reader for `load_bson_cached`. `mtime_ns` only keys the cache."""
+    return load_bson(file)
+
+
 def load_json(file: str | Path, encoding: str = "utf-8") -> dict[str, Any]:
     """Load dictionary from JSON.
 
@@ -127,9 +150,14 @@ def load_yaml(file: str | Path, encoding: str = "utf-8") -> dict[str, Any]:
         encoding (str):
             Text encoding format.
     """
+    # deferred: the MetaHQ config is usually read from its JSON copy instead
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(file, "r", encoding=encoding) as stream:
         try:
-            return yaml.safe_load(stream)
+            return yaml.load(stream, Loader=loader)
         except yaml.YAMLError as e:
             sys.exit(str(e))
 
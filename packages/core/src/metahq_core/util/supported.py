@@ -7,9 +7,12 @@ Functions beginning with an underscore are intended to be called through the
 Author: Parker Hicks
 Date: 2025-04-15
 
-Last updated: 2026-02-02 by Parker Hicks
+Last updated: 2026-10-16 by Parker Hicks
 """
 
+import json
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -61,7 +64,7 @@ def _ecodes() -> dict[str, str]:
 
 def _formats() -> list[str]:
     """Returns supported save formats."""
-    return ["parquet", "tsv", "csv", "json"]
+    return ["parquet", "arrow", "tsv", "csv", "json"]
 
 
 def _levels() -> list[str]:
@@ -169,14 +172,59 @@ def get_annotations(level: Literal["sample", "series"]) -> Path:
 
 
 def get_config():
-    """Loads the MetaHQ config file."""
-    config = load_yaml(get_config_file())
+    """Loads the MetaHQ config file.
+
+    The parsed config is reused until the file is modified, since every data path
+    helper resolves through it. Each call returns a copy, so callers may modify it.
+    """
+    file = get_config_file()
+    stat = file.stat()
+    config = _load_config(str(file), stat.st_mtime_ns, stat.st_size)
     if config is None:
         raise RuntimeError(
             "The MetaHQ configuration is contaminated. Run `metahq setup`."
         )
 
-    return config
+    return dict(config)
+
+
+@lru_cache(maxsize=1)
+def _load_config(file: str, mtime_ns: int, size: int) -> dict | None:
+    """Cached reader for `get_config`.
+
+    Reads the JSON copy of the config when it was written from exactly this
+    version of the YAML file, which avoids importing and running the YAML parser
+    on every CLI invocation. Otherwise the YAML file is parsed.
+    """
+    try:
+        copy = json.loads(Path(f"{file}.json").read_text(encoding="utf-8"))
+        if copy["mtime_ns"] == mtime_ns and copy["size"] == size:
+            return copy["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    return load_yaml(file)
+
+
+def save_config_json(config: dict | None, file: str | Path):
+    """Writes the JSON copy of a config file read by `get_config`.
+
+    The copy records the modification time and size of the YAML file, so it is
+    ignored as soon as the YAML file is edited.
+
+    Arguments:
+        config (dict | None):
+            The parsed config.
+
+        file (str | Path):
+            Path to the YAML config file. The copy is written to `<file>.json`.
+    """
+    try:
+        stat = Path(file).stat()
+        copy = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "config": config}
+        Path(f"{file}.json").write_text(json.dumps(copy), encoding="utf-8")
+    except OSError:
+        pass  # the YAML file is still read when the copy cannot be written
 
 
 def get_config_file():
@@ -275,25 +323,16 @@ def get_ontology_search_db() -> Path:
 
 def get_ontology_families(onto: str) -> dict[str, Path]:
     """Returns the path to files outlining ontology relationships."""
-    mondo = get_ontology_dirs("mondo")
-    uberon = get_ontology_dirs("uberon")
-    opt = {
-        "mondo": {
-            "relations": mondo / "relations.parquet",
-            "ids": mondo / "id.txt",
-            "systems": mondo / "systems.txt",
-        },
-        "uberon": {
-            "relations": uberon / "relations.parquet",
-            "ids": uberon / "id.txt",
-            "systems": uberon / "systems.txt",
-        },
-    }
-    supported_relations = list(opt.keys())
-    if not onto in opt:
+    supported_relations = ["mondo", "uberon"]
+    if not onto in supported_relations:
         raise ValueError(f"Expected onto in {supported_relations}, got {onto}.")
 
-    return opt[onto]
+    onto_dir = get_ontology_dirs(onto)
+    return {
+        "relations": onto_dir / "relations.parquet",
+        "ids": onto_dir / "id.txt",
+        "systems": onto_dir / "systems.txt",
+    }
 
 
 def get_technologies() -> Path:
@@ -374,8 +413,9 @@ def onto_relations(query: str, relatives: str) -> Path:
     """Returns the path to a queried ontology."""
     _supported = supported("ontologies")
     if query in _supported:
-        if relatives in get_ontology_families(query).keys():
-            return get_ontology_families(query)[relatives]
+        families = get_ontology_families(query)
+        if relatives in families:
+            return families[relatives]
         raise ValueError(f"Relatives for {query} do not exist.")
     raise ValueError(f"Expected ontology in {_supported}, got {query}.")
 
@@ -400,31 +440,40 @@ def technologies(query: str) -> str:
 # =======================================================
 
 
-def _supported() -> dict[str, list[str]]:
-    """Returns mapping between all supported entities and their items."""
+def _supported_getters() -> dict[str, Callable[[], list[str]]]:
+    """Returns mapping between all supported entities and the functions listing their items."""
     return {
-        "attributes": _attributes(),
-        "age_groups": _age_groups(),
-        "ecodes": list(_ecodes().keys()),
-        "formats": _formats(),
-        "levels": _levels(),
-        "licenses": _license_categories(),
-        "modes": _modes(),
-        "ontologies": _ontologies(),
-        "sample_metadata": _sample_metadata(),
-        "series_metadata": _series_metadata(),
-        "species": list(species_map().keys()),
-        "technologies": _technologies(),
-        "log_levels": _log_levels(),
+        "attributes": _attributes,
+        "age_groups": _age_groups,
+        "ecodes": lambda: list(_ecodes().keys()),
+        "formats": _formats,
+        "levels": _levels,
+        "licenses": _license_categories,
+        "modes": _modes,
+        "ontologies": _ontologies,
+        "sample_metadata": _sample_metadata,
+        "series_metadata": _series_metadata,
+        "species": lambda: list(species_map().keys()),
+        "technologies": _technologies,
+        "log_levels": _log_levels,
     }
 
 
+def _supported() -> dict[str, list[str]]:
+    """Returns mapping between all supported entities and their items."""
+    return {entity: getter() for entity, getter in _supported_getters().items()}
+
+
 def _supported_items() -> list[str]:
-    return list(_supported().keys())
+    return list(_supported_getters().keys())
 
 
 def supported(entity: str) -> list[str]:
-    """Returns supported items for a specified entity."""
-    if entity in _supported():
-        return _supported()[entity]
-    raise ValueError(f"Expected entity in {_supported_items()}, got {entity}.")
+    """Returns supported items for a specified entity.
+
+    Only the items of the requested entity are built.
+    """
+    getters = _supported_getters()
+    if entity in getters:
+        return getters[entity]()
+    raise ValueError(f"Expected entity in {list(getters)}, got {entity}.")
@@ -368,6 +368,27 @@ class TestLongAnnotations:
         assert "UBERON:0002" in wide.columns
         assert "UBERON:0003" in wide.columns
 
+    def test_pivot_wide_with_terms(self):
+        """Test pivoting only the requested terms"""
+        data = pl.DataFrame(
+            {
+                "sample": ["GSM1", "GSM2", "GSM3"],
+                "series": ["GSE1", "GSE1", "GSE2"],
+                "platform": ["GPL1", "GPL1", "GPL2"],
+                "id": ["UBERON:0001|UBERON:0002", "UBERON:0003", "UBERON:0002"],
+                "value": ["brain|liver", "heart", "liver"],
+            }
+        )
+        long_anno = LongAnnotations(data)
+        wide = long_anno.pivot_wide(
+            "sample", "id", ["sample", "series", "platform"], terms=["UBERON:0002"]
+        )
+
+        assert "UBERON:0002" in wide.columns
+        assert "UBERON:0001" not in wide.columns
+        assert "UBERON:0003" not in wide.columns
+        assert wide["sample"].to_list() == ["GSM1", "GSM3"]
+
 
 # =======================================================
 # ==== UnParsedEntry Tests
@@ -622,7 +643,7 @@ class TestUnParsedEntry:
 class TestQueryInit:
     """Test Query class initialization"""
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_init_basic(self, mock_get_annotations, mock_load_bson):
         """Test basic initialization."""
@@ -639,7 +660,7 @@ class TestQueryInit:
         assert query.species == "homo sapiens"
         assert query.technology == "rnaseq"
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_init_custom_parameters(self, mock_get_annotations, mock_load_bson):
         """Test initialization with custom parameters"""
@@ -660,7 +681,7 @@ class TestQueryInit:
         assert query.level == "series"
         assert query.technology == "microarray"
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_load_ecode_shorthand(self, mock_get_annotations, mock_load_bson):
         """Test loading evidence code with shorthand"""
@@ -670,7 +691,7 @@ class TestQueryInit:
         query = Query("geo", "tissue", "sample", "expert", "homo sapiens", "rnaseq")
         assert query.ecodes == ["expert-curated"]
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_load_ecode_full_name(self, mock_get_annotations, mock_load_bson):
         """Test loading evidence code with full name"""
@@ -682,7 +703,7 @@ class TestQueryInit:
         )
         assert query.ecodes == ["expert-curated"]
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_load_ecode_invalid(self, mock_get_annotations, mock_load_bson):
         """Test that invalid evidence code raises error"""
@@ -692,7 +713,7 @@ class TestQueryInit:
         with pytest.raises(ValueError, match="Invalid ecode query"):
             Query("geo", "tissue", "sample", "invalid-ecode", "homo sapiens", "rnaseq")
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_load_species_shorthand(self, mock_get_annotations, mock_load_bson):
         """Test loading species with shorthand"""
@@ -702,7 +723,7 @@ class TestQueryInit:
         query = Query("geo", "tissue", "sample", "expert-curated", "human", "rnaseq")
         assert query.species == "homo sapiens"
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_load_species_invalid(self, mock_get_annotations, mock_load_bson):
         """Test that invalid species raises error"""
@@ -718,7 +739,7 @@ class TestQueryInit:
 class TestQueryMethods:
     """Test Query class methods"""
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_assign_index_groups_sample(self, mock_get_annotations, mock_load_bson):
         """Test assigning index and groups for sample level"""
@@ -733,7 +754,7 @@ class TestQueryMethods:
         assert index == "sample"
         assert groups == ("series", "platform")
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_assign_index_groups_series(self, mock_get_annotations, mock_load_bson):
         """Test assigning index and groups for series level"""
@@ -748,7 +769,7 @@ class TestQueryMethods:
         assert index == "series"
         assert groups == ("platform",)
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_get_accession_ids_sample_level(
         self, mock_get_annotations, mock_load_bson, mock_annotations_dict
@@ -766,7 +787,7 @@ class TestQueryMethods:
         assert accessions["series"] == "GSE1"
         assert accessions["platform"] == "GPL570"
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_get_accession_ids_series_level(
         self, mock_get_annotations, mock_load_bson, mock_annotations_dict
@@ -784,7 +805,7 @@ class TestQueryMethods:
         assert accessions["series"] == "GSE1"
         assert accessions["platform"] == "GPL570"
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_get_accession_ids_missing_ids(self, mock_get_annotations, mock_load_bson):
         """Test getting accession IDs when some are missing"""
@@ -810,7 +831,7 @@ class TestQueryMethods:
         assert accessions["series"] == "NA"
         assert accessions["platform"] == "NA"
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_get_valid_annotations(
         self, mock_get_annotations, mock_load_bson, mock_annotations_dict
@@ -828,7 +849,7 @@ class TestQueryMethods:
         assert values == "brain"
         assert sources == "source1"
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_get_valid_annotations_wrong_species(
         self, mock_get_annotations, mock_load_bson, mock_annotations_dict
@@ -855,7 +876,7 @@ class TestQueryMethods:
 class TestQueryLicense:
     """Test license parameter on Query."""
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_default_license_is_any(self, mock_get_annotations, mock_load_bson):
         """Query defaults to license='any', which sets allowed_sources to None."""
@@ -865,7 +886,7 @@ class TestQueryLicense:
         query = Query("geo", "tissue", "sample", "expert", "human", "rnaseq")
         assert query.allowed_sources is None
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_permissive_license_sets_allowed_sources(
         self, mock_get_annotations, mock_load_bson
@@ -882,7 +903,7 @@ class TestQueryLicense:
         # All entries should be lowercase
         assert all(s == s.lower() for s in query.allowed_sources)
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_permissive_license_excludes_nc_sources(
         self, mock_get_annotations, mock_load_bson
@@ -900,7 +921,7 @@ class TestQueryLicense:
         assert "disignatlas" not in query.allowed_sources
         assert "sirota_2011" not in query.allowed_sources
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_nc_license_includes_only_nc_sources(
         self, mock_get_annotations, mock_load_bson
@@ -917,7 +938,7 @@ class TestQueryLicense:
         assert "krishnanlab" not in query.allowed_sources
         assert "ale" not in query.allowed_sources
 
-    @patch("metahq_core.query.load_bson")
+    @patch("metahq_core.query.load_bson_cached")
     @patch("metahq_core.query.get_annotations")
     def test_invalid_license_raises_value_error(
         self, mock_get_annotations, mock_load_bson
@@ -10,13 +10,21 @@ Date: 2025-11-19
 Last updated: 2025-11-19 by Claude Code
 """
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import polars as pl
 import pytest
 
-from metahq_core.relations_loader import COL_ID, ROW_ID, RelationsLoader
+from metahq_core.relations_loader import (
+    COL_ID,
+    ROW_ID,
+    RelationsLoader,
+    _relation_terms,
+    relation_terms,
+)
 
 
 @pytest.fixture
@@ -325,3 +333,38 @@ class TestRelationsLoaderEdgeCases:
         # Each term should be its own descendant
         for term in ["A", "B", "C", "D"]:
             assert term in descendants.get(term, [])
+
+
+class TestRelationTerms:
+    """Test suite for the cached relations term lookup."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Reset the cached schemas between tests."""
+        _relation_terms.cache_clear()
+        yield
+        _relation_terms.cache_clear()
+
+    def test_returns_terms_in_order(self, sample_parquet_file):
+        """Test that the terms match the relations columns."""
+        assert relation_terms(sample_parquet_file) == ["A", "B", "C", "D"]
+
+    def test_reads_schema_once(self, sample_parquet_file):
+        """Test that repeated lookups reuse the cached schema."""
+        with patch(
+            "metahq_core.relations_loader.pl.scan_parquet", wraps=pl.scan_parquet
+        ) as mock_scan:
+            relation_terms(sample_parquet_file)
+            relation_terms(Path(sample_parquet_file))
+
+        assert mock_scan.call_count == 1
+
+    def test_invalidated_when_file_changes(self, sample_parquet_file):
+        """Test that rewriting the file is picked up."""
+        relation_terms(sample_parquet_file)
+
+        pl.DataFrame({"X": [1, 0], "Y": [1, 1]}).write_parquet(sample_parquet_file)
+        stat = os.stat(sample_parquet_file)
+        os.utime(sample_parquet_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert relation_terms(sample_parquet_file) == ["X", "Y"]
@@ -0,0 +1,94 @@
+"""
+Unit tests for the curation exporters.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+from unittest.mock import Mock, patch
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from metahq_core.config import SOURCES_COL
+from metahq_core.curations.labels import Labels
+from metahq_core.export.labels import LabelsExporter
+
+
+@pytest.fixture
+def labels():
+    """small Labels curation with sources"""
+    data = pl.DataFrame(
+        {
+            "MONDO:0001657": [1, 0, -1],
+            "MONDO:0004790": [0, 1, 2],
+        }
+    )
+    ids = pl.DataFrame(
+        {
+            "sample": ["GSM3", "GSM1", "GSM2"],
+            "series": ["GSE1", "GSE1", "GSE2"],
+            SOURCES_COL: ["ale", "ale|gemma", "gemma"],
+        }
+    )
+    return Labels(data=data, ids=ids, index_col="sample", group_cols=("series",))
+
+
+@pytest.fixture
+def exporter():
+    """LabelsExporter with a mock logger"""
+    return LabelsExporter("disease", "sample", logger=Mock(), verbose=False)
+
+
+class TestSaveArrow:
+    """test saving curations as Arrow IPC files"""
+
+    def test_to_arrow_round_trip(self, exporter, labels, tmp_path):
+        """test labels saved as arrow read back with the same rows and columns"""
+        file = tmp_path / "labels.arrow"
+
+        with patch("metahq_core.export.labels.save_citations") as mock_citations:
+            exporter.save(labels, "arrow", file, citation_config=Mock())
+
+        mock_citations.assert_called_once()
+        result = pl.read_ipc(file)
+        assert result.columns == [
+            "sample",
+            SOURCES_COL,
+            "MONDO:0001657",
+            "MONDO:0004790",
+        ]
+        assert result["sample"].to_list() == ["GSM1", "GSM2", "GSM3"]
+        assert result["MONDO:0004790"].to_list() == [1, 2, 0]
+
+
+class TestSaveParquet:
+    """test parquet row group sizing and compression"""
+
+    @pytest.mark.parametrize(
+        "height, row_groups",
+        [
+            (100, 1),  # below the minimum row group size
+            (20_000, 4),  # split into about four groups
+        ],
+    )
+    def test_row_groups(self, exporter, tmp_path, height, row_groups):
+        """test row groups are sized from the frame height"""
+        file = tmp_path / "result.parquet"
+        exporter._save_parquet(pl.DataFrame({"value": range(height)}), file)
+
+        metadata = pq.ParquetFile(file).metadata
+        assert metadata.num_row_groups == row_groups
+        assert metadata.num_rows == height
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    def test_row_groups_are_capped(self, exporter, tmp_path):
+        """test large frames use row groups of at most PARQUET_ROW_GROUP_SIZE rows"""
+        file = tmp_path / "result.parquet"
+        with patch("metahq_core.export.base.PARQUET_ROW_GROUP_SIZE", 2_000):
+            exporter._save_parquet(pl.DataFrame({"value": range(20_000)}), file)
+
+        assert pq.ParquetFile(file).metadata.num_row_groups == 10
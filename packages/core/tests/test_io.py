@@ -0,0 +1,58 @@
+"""
+Unit tests for io utilities.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from bson import BSON
+
+from metahq_core.util.io import _load_bson_cached, load_bson, load_bson_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """reset cached databases between tests"""
+    _load_bson_cached.cache_clear()
+    yield
+    _load_bson_cached.cache_clear()
+
+
+@pytest.fixture
+def bson_file(tmp_path):
+    """small annotations-like BSON file"""
+    file = tmp_path / "anno.bson"
+    file.write_bytes(BSON.encode({"GSM1": {"accession_ids": {"series": "GSE1"}}}))
+    return file
+
+
+def test_load_bson_cached_matches_load_bson(bson_file):
+    """test cached loading returns the decoded database"""
+    assert load_bson_cached(bson_file) == load_bson(bson_file)
+
+
+def test_load_bson_cached_decodes_once(bson_file):
+    """test repeated loads reuse the decoded database"""
+    with patch("metahq_core.util.io.load_bson", wraps=load_bson) as mock_load:
+        first = load_bson_cached(bson_file)
+        second = load_bson_cached(str(bson_file))
+
+    assert first is second
+    assert mock_load.call_count == 1
+
+
+def test_load_bson_cached_reloads_modified_file(bson_file):
+    """test a rewritten database is picked up"""
+    load_bson_cached(bson_file)
+
+    bson_file.write_bytes(BSON.encode({"GSM2": {}}))
+    stat = os.stat(bson_file)
+    os.utime(bson_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert list(load_bson_cached(bson_file)) == ["GSM2"]
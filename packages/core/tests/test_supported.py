@@ -0,0 +1,92 @@
+"""
+Unit tests for MetaHQ config access.
+
+Author: Parker Hicks
+Date: 2026-10-16
+
+Last updated: 2026-10-16 by Parker Hicks
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from metahq_core.util.supported import _load_config, get_config, save_config_json
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """minimal MetaHQ config file"""
+    _load_config.cache_clear()
+    file = tmp_path / "config.yaml"
+    file.write_text(yaml.safe_dump({"data_dir": "/data", "version": "v1"}))
+    with patch("metahq_core.util.supported.get_config_file", return_value=file):
+        yield file
+    _load_config.cache_clear()
+
+
+def test_get_config_parses_once(config_file):
+    """test repeated reads of an unchanged config reuse the parsed file"""
+    with patch("metahq_core.util.supported.load_yaml") as mock_load:
+        mock_load.return_value = {"data_dir": "/data", "version": "v1"}
+        get_config()
+        get_config()
+
+    mock_load.assert_called_once()
+
+
+def test_get_config_returns_copy(config_file):
+    """test callers modifying the config do not change the cached config"""
+    get_config()["data_dir"] = "/elsewhere"
+
+    assert get_config()["data_dir"] == "/data"
+
+
+def test_get_config_reloads_modified_file(config_file):
+    """test a rewritten config is parsed again"""
+    get_config()
+    config_file.write_text(yaml.safe_dump({"data_dir": "/new", "version": "v2"}))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_config() == {"data_dir": "/new", "version": "v2"}
+
+
+def test_get_config_does_not_write_json_copy(config_file):
+    """test reading the config leaves the MetaHQ directory untouched"""
+    get_config()
+
+    assert not config_file.with_name("config.yaml.json").exists()
+
+
+def test_get_config_reads_json_copy(config_file):
+    """test a JSON copy saved from the current YAML file skips YAML parsing"""
+    save_config_json({"data_dir": "/data", "version": "v1"}, config_file)
+
+    with patch("metahq_core.util.supported.load_yaml") as mock_load:
+        assert get_config() == {"data_dir": "/data", "version": "v1"}
+
+    mock_load.assert_not_called()
+
+
+def test_get_config_ignores_stale_json_copy(config_file):
+    """test a JSON copy of an older YAML file is ignored even when it is newer"""
+    save_config_json({"data_dir": "/data", "version": "v1"}, config_file)
+    json_file = config_file.with_name("config.yaml.json")
+
+    config_file.write_text(yaml.safe_dump({"data_dir": "/new", "version": "v2"}))
+    stat = json_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1))
+
+    assert get_config() == {"data_dir": "/new", "version": "v2"}
+
+
+def test_get_config_ignores_unstamped_json_copy(config_file):
+    """test a JSON copy without the YAML file's stamp is ignored"""
+    json_file = config_file.with_name("config.yaml.json")
+    json_file.write_text(json.dumps({"data_dir": "/old", "version": "v0"}))
+
+    assert get_config() == {"data_dir": "/data", "version": "v1"}